@@ -13,6 +13,11 @@ install_requires = [
     "importlib_metadata",
 ]
 
+extras_require = {
+    "fast": ["numpy"],
+    "parquet": ["pyarrow"],
+}
+
 
 setup(
     name="spacetar",
@@ -49,6 +54,7 @@ setup(
     install_package_data=True,
     python_requires=">=3.5, <4",
     install_requires=install_requires,
+    extras_require=extras_require,
     entry_points={"console_scripts": ["spacetar=spacetar.terminal:main"]},
     project_urls={
         "Documentation": "https://spacetar.readthedocs.io",
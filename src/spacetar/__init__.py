@@ -1,18 +1,28 @@
-from .core import __version__
+import importlib
 
-from .display import (
-    summarize_source,
-    summarize_molecule,
-    summarize_telescope,
-)
+from typing import Any
 
-from .search import (
-    search_source,
-    search_molecule,
-    search_telescope,
-)
+
+_lazy = {
+    "search_text": ".search",
+    "export_source": ".search",
+    "export_molecule": ".search",
+    "export_telescope": ".search",
+    "search_fuzzy": ".search",
+    "search_source": ".search",
+    "search_molecule": ".search",
+    "search_telescope": ".search",
+    "summarize_source": ".display",
+    "summarize_molecule": ".display",
+    "summarize_telescope": ".display",
+}
 
 __all__ = [
+    "export_source",
+    "export_molecule",
+    "export_telescope",
+    "search_text",
+    "search_fuzzy",
     "search_source",
     "search_molecule",
     "summarize_source",
@@ -20,3 +30,27 @@ __all__ = [
     "summarize_molecule",
     "summarize_telescope",
 ]
+
+
+def __getattr__(name: str) -> Any:
+
+    """"""
+
+    if name == "__version__":
+        from .constants import _version
+
+        value = _version()
+        globals()[name] = value
+        return value
+    if name in _lazy:
+        value = getattr(importlib.import_module(_lazy[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+
+    """"""
+
+    return sorted([*globals(), *_lazy, "__version__"])
@@ -0,0 +1,107 @@
+import typing
+import asyncio
+import functools
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from . import search
+from .core import connections
+from .search import Results
+
+
+_lock = threading.Lock()
+_workers = 4
+_pool: typing.Dict[str, typing.Any] = {"executor": None, "workers": None}
+
+
+def executor() -> ThreadPoolExecutor:
+
+    """"""
+
+    with _lock:
+        if _pool["executor"] is None:
+            workers = _pool["workers"] or min(_workers, connections.settings["size"])
+            _pool["executor"] = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="spacetar",
+            )
+        return _pool["executor"]
+
+
+def configure(workers: typing.Optional[int] = None) -> None:
+
+    """"""
+
+    with _lock:
+        previous, _pool["executor"] = _pool["executor"], None
+        _pool["workers"] = workers
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+async def run(function: typing.Callable, *args: typing.Any, **kwargs: typing.Any):
+
+    """"""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor(),
+        functools.partial(function, *args, **kwargs),
+    )
+
+
+def _materialised(function: typing.Callable) -> typing.Callable[..., Results]:
+
+    """"""
+
+    return lambda *args, **kwargs: function(*args, **kwargs).all()
+
+
+async def search_molecule(*args, **kwargs) -> Results:
+
+    """"""
+
+    return await run(_materialised(search.search_molecule), *args, **kwargs)
+
+
+async def search_source(*args, **kwargs) -> Results:
+
+    """"""
+
+    return await run(_materialised(search.search_source), *args, **kwargs)
+
+
+async def search_telescope(*args, **kwargs) -> Results:
+
+    """"""
+
+    return await run(_materialised(search.search_telescope), *args, **kwargs)
+
+
+async def search_text(*args, **kwargs) -> Results:
+
+    """"""
+
+    return await run(search.search_text, *args, **kwargs)
+
+
+async def gather_molecules(searches: typing.Iterable[typing.Dict]) -> typing.List:
+
+    """"""
+
+    return list(await asyncio.gather(*[search_molecule(**_) for _ in searches]))
+
+
+async def gather_sources(searches: typing.Iterable[typing.Dict]) -> typing.List:
+
+    """"""
+
+    return list(await asyncio.gather(*[search_source(**_) for _ in searches]))
+
+
+async def gather_telescopes(searches: typing.Iterable[typing.Dict]) -> typing.List:
+
+    """"""
+
+    return list(await asyncio.gather(*[search_telescope(**_) for _ in searches]))
@@ -0,0 +1,138 @@
+import time
+import typing
+import threading
+
+from collections import OrderedDict
+
+from . import core
+
+
+def _frozen(value: typing.Any) -> typing.Any:
+
+    """"""
+
+    if isinstance(value, (list, tuple)):
+        return tuple([_frozen(_) for _ in value])
+    return value
+
+
+class ResultCache:
+
+    """"""
+
+    def __init__(self, maxsize: int = 128, ttl: typing.Optional[float] = None):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.maxsize = maxsize
+        self._stamp: typing.Optional[typing.Tuple] = None
+        self._lock = threading.Lock()
+        self._memo: typing.OrderedDict = OrderedDict()
+        self._signatures: typing.Dict[typing.Callable, typing.Tuple] = {}
+
+    def __str__(self) -> str:
+        return (
+            f"<ResultCache | hits: {self.hits}, misses: {self.misses}, "
+            f"size: {len(self._memo)}/{self.maxsize}>"
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def info(self) -> typing.Dict:
+
+        """"""
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "maxsize": self.maxsize,
+            "currsize": len(self._memo),
+            "ttl": self.ttl,
+        }
+
+    def clear(self) -> None:
+
+        """"""
+
+        with self._lock:
+            self._memo.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+
+    def resize(self, maxsize: int) -> None:
+
+        """"""
+
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._memo) > max(maxsize, 0):
+                self._memo.popitem(last=False)
+                self.evictions += 1
+
+    def key(
+        self,
+        function: typing.Callable,
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> typing.Tuple:
+
+        """"""
+
+        if function not in self._signatures:
+            code = function.__code__
+            names = code.co_varnames[: code.co_argcount]
+            defaults = function.__defaults__ or ()
+            self._signatures[function] = (
+                names,
+                dict(zip(names[len(names) - len(defaults) :], defaults)),
+            )
+        names, defaults = self._signatures[function]
+
+        arguments = {**defaults, **dict(zip(names, args)), **kwargs}
+        return (
+            function.__name__,
+            tuple([(name, _frozen(value)) for name, value in arguments.items()]),
+        )
+
+    def get(self, key: typing.Hashable, load: typing.Callable[[], typing.Any]):
+
+        """"""
+
+        stamp = core._stamp()
+        now = time.monotonic()
+
+        with self._lock:
+            if stamp != self._stamp:
+                if self._memo:
+                    self.invalidations += 1
+                    self._memo.clear()
+                self._stamp = stamp
+            cached = self._memo.get(key)
+            if cached is not None:
+                if (self.ttl is None) or (now - cached[0] < self.ttl):
+                    self.hits += 1
+                    self._memo.move_to_end(key)
+                    return cached[1]
+                del self._memo[key]
+                self.evictions += 1
+            self.misses += 1
+
+        value = load()
+
+        with self._lock:
+            if (self.maxsize > 0) and (self._stamp == stamp):
+                self._memo[key] = (now, value)
+                while len(self._memo) > self.maxsize:
+                    self._memo.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+
+results = ResultCache()
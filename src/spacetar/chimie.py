@@ -1,9 +1,9 @@
 import re
 import typing as typ
-import pyparsing as pyp  # type: ignore
+import threading
 
 from textwrap import dedent
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 
 symbols = (
@@ -284,6 +284,32 @@ SUPS = {
 }
 
 
+_element = r"""
+A[cglmrstu]|
+B[aehikr]?|
+C[adeflmorsu]?|
+D[bsy]|
+E[rsu]|
+F[emr]?|
+G[ade]|
+H[efgos]?|
+I[nr]?|
+Kr?|
+L[airu]|
+M[dgnot]|
+N[abdeiop]?|
+Os?|
+P[abdmortu]?|
+R[abefghnu]|
+S[bcegimnr]?|
+T[abcehilm]|
+Uu[bhopqst]|U|V|W|Xe|Yb?|Z[nr]
+"""
+
+_elements = re.compile(_element, flags=re.VERBOSE)
+_numbers = {symbol: Z + 1 for Z, symbol in enumerate(symbols)}
+
+
 class ParseError(Exception):
 
     """"""
@@ -295,36 +321,15 @@ def _formula_parser():
 
     """"""
 
+    import pyparsing as pyp  # type: ignore
+
     lpar = pyp.Suppress("(")
     rpar = pyp.Suppress(")")
 
     integer = pyp.Word(pyp.nums)
     integer.setParseAction(lambda token: int(token[0]))
 
-    element = pyp.Regex(
-        r"""
-        A[cglmrstu]|
-        B[aehikr]?|
-        C[adeflmorsu]?|
-        D[bsy]|
-        E[rsu]|
-        F[emr]?|
-        G[ade]|
-        H[efgos]?|
-        I[nr]?|
-        Kr?|
-        L[airu]|
-        M[dgnot]|
-        N[abdeiop]?|
-        Os?|
-        P[abdmortu]?|
-        R[abefghnu]|
-        S[bcegimnr]?|
-        T[abcehilm]|
-        Uu[bhopqst]|U|V|W|Xe|Yb?|Z[nr]
-        """,
-        flags=re.VERBOSE,
-    )
+    element = pyp.Regex(_element, flags=re.VERBOSE)
 
     formula = pyp.Forward()
 
@@ -379,6 +384,45 @@ def _formula_parser():
     return formula
 
 
+def _fast_parser(stoich_str: str) -> typ.Optional[typ.List[typ.Tuple[str, int]]]:
+
+    """"""
+
+    size = len(stoich_str)
+    stack: typ.List[typ.Dict] = [{}]
+
+    def amount(start: int) -> typ.Tuple[int, int]:
+        end = start
+        while end < size and stoich_str[end] in "0123456789":
+            end += 1
+        return (int(stoich_str[start:end]) if end > start else 1), end
+
+    index = 0
+    while index < size:
+        char = stoich_str[index]
+        if char == "(":
+            stack.append({})
+            index += 1
+        elif char == ")":
+            if len(stack) == 1 or not stack[-1]:
+                return None
+            group = stack.pop()
+            mult, index = amount(index + 1)
+            for element, count in group.items():
+                stack[-1][element] = stack[-1].get(element, 0) + count * mult
+        else:
+            match = _elements.match(stoich_str, index)
+            if match is None:
+                return None
+            element = match.group()
+            count, index = amount(match.end())
+            stack[-1][element] = stack[-1].get(element, 0) + count
+
+    if len(stack) != 1 or not stack[0]:
+        return None
+    return list(stack[0].items())
+
+
 def _partition_formula(formula: str) -> typ.List:
 
     """"""
@@ -411,43 +455,153 @@ def _partition_formula(formula: str) -> typ.List:
         return [prefix_str, formula, ""]
 
 
-def composition(formula: str) -> typ.Dict:
+class FormulaEngine:
 
     """"""
 
-    composed: typ.Dict = {}
+    def __init__(self, maxsize: int = 1024, fast: bool = True):
+        self.hits = 0
+        self.fast = fast
+        self.misses = 0
+        self.maxsize = maxsize
+        self._grammar = None
+        self._lock = threading.Lock()
+        self._memo: typ.OrderedDict = OrderedDict()
 
-    _, stoich_str, charge_str = _partition_formula(formula)
+    def __str__(self) -> str:
+        return (
+            f"<FormulaEngine | hits: {self.hits}, misses: {self.misses}, "
+            f"size: {len(self._memo)}/{self.maxsize}>"
+        )
 
-    stoich = {
-        symbols.index(index) + 1: amount
-        for (
-            index,
-            amount,
-        ) in _formula_parser().parseString(stoich_str)
-    }
+    def __repr__(self) -> str:
+        return str(self)
 
-    for element, amount in stoich.items():
-        if element not in composed:
-            composed[element] = amount
-        else:
-            composed[element] += amount
-
-    if charge_str != "":
-        matches = re.search(r"([+-])((?:\d+)?)", charge_str)
-        if matches:
-            sign, charge = matches.groups()
-            composed[0] = int(
-                "".join(
-                    [
-                        sign,
-                        (charge if charge != "" else "1"),
-                    ]
+    @property
+    def grammar(self):
+
+        """"""
+
+        if self._grammar is None:
+            self._grammar = _formula_parser()
+        return self._grammar
+
+    def info(self) -> typ.Dict:
+
+        """"""
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "currsize": len(self._memo),
+        }
+
+    def clear(self) -> None:
+
+        """"""
+
+        with self._lock:
+            self._memo.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def resize(self, maxsize: int) -> None:
+
+        """"""
+
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._memo) > max(maxsize, 0):
+                self._memo.popitem(last=False)
+
+    def parse(self, formula: str) -> typ.Dict:
+
+        """"""
+
+        with self._lock:
+            composed = self._memo.get(formula)
+            if composed is not None:
+                self.hits += 1
+                self._memo.move_to_end(formula)
+                return dict(composed)
+            self.misses += 1
+
+        composed = self._compose(formula)
+
+        with self._lock:
+            if self.maxsize > 0:
+                self._memo[formula] = composed
+                if len(self._memo) > self.maxsize:
+                    self._memo.popitem(last=False)
+        return dict(composed)
+
+    def compositions(self, formulas: typ.Iterable[str]) -> typ.List[typ.Dict]:
+
+        """"""
+
+        formulas = list(formulas)
+        parsed = {_: self.parse(_) for _ in dict.fromkeys(formulas)}
+        return [dict(parsed[_]) for _ in formulas]
+
+    def _compose(self, formula: str) -> typ.Dict:
+
+        """"""
+
+        composed: typ.Dict = {}
+
+        _, stoich_str, charge_str = _partition_formula(formula)
+
+        parsed = _fast_parser(stoich_str) if self.fast else None
+        if parsed is None:
+            parsed = self.grammar.parseString(stoich_str)
+
+        stoich = {
+            _numbers[index]: amount
+            for (
+                index,
+                amount,
+            ) in parsed
+        }
+
+        for element, amount in stoich.items():
+            if element not in composed:
+                composed[element] = amount
+            else:
+                composed[element] += amount
+
+        if charge_str != "":
+            matches = re.search(r"([+-])((?:\d+)?)", charge_str)
+            if matches:
+                sign, charge = matches.groups()
+                composed[0] = int(
+                    "".join(
+                        [
+                            sign,
+                            (charge if charge != "" else "1"),
+                        ]
+                    )
                 )
-            )
-        else:
-            composed[0] = 0
-    return composed
+            else:
+                composed[0] = 0
+        return composed
+
+
+formulae = FormulaEngine()
+
+
+def composition(formula: str) -> typ.Dict:
+
+    """"""
+
+    return formulae.parse(formula)
+
+
+def compositions(formulas: typ.Iterable[str]) -> typ.List[typ.Dict]:
+
+    """"""
+
+    return formulae.compositions(formulas)
 
 
 def molecular_mass(composed: typ.Dict) -> float:
@@ -0,0 +1,26 @@
+import pathlib
+
+
+_data = pathlib.Path(__file__).parent.resolve().joinpath("data")
+_database = _data / "spacetar.db"
+_bands = ["sub-mm", "mm", "cm", "IR", "Vis", "UV"]
+_logo = """
+                               __            
+   _________  ____ _________  / /_____ ______
+  / ___/ __ \/ __ `/ ___/ _ \/ __/ __ `/ ___/
+ (__  ) /_/ / /_/ / /__/  __/ /_/ /_/ / /    
+/____/ .___/\__,_/\___/\___/\__/\__,_/_/     
+    /_/                                      
+"""
+
+
+def _version() -> str:
+
+    """"""
+
+    import importlib_metadata as imp
+
+    try:
+        return imp.version("spacetar")
+    except imp.PackageNotFoundError:
+        return "unknown"
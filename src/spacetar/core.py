@@ -1,36 +1,316 @@
 import re
 import json
 import typing
+import hashlib
 import pathlib
+import threading
 import sqlalchemy as sql
 import sqlalchemy.orm as orm
-import importlib_metadata as imp
+import sqlalchemy.pool as pool
 
+from collections import defaultdict
+
+from .constants import _data, _logo, _bands, _version, _database
 from .chimie import symbols, composition, molecular_mass
 
 
-try:
-    __version__ = imp.version("spacetar")
-except imp.PackageNotFoundError:
-    pass
+def __getattr__(name: str) -> typing.Any:
+
+    """"""
+
+    if name == "__version__":
+        return _version()
+    if name == "Engine":
+        return connections.engine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 _sep = re.compile(r"\s*[,]\s*")
-_data = pathlib.Path(__file__).parent.resolve().joinpath("data")
-_database = _data / "spacetar.db"
 _nullnum = lambda _: (_ if _ is not None else 0.0)
-_bands = ["sub-mm", "mm", "cm", "IR", "Vis", "UV"]
-_raw = lambda name: json.loads((_data / f"{name}.json").read_text())
-_logo = """
-                               __            
-   _________  ____ _________  / /_____ ______
-  / ___/ __ \/ __ `/ ___/ _ \/ __/ __ `/ ___/
- (__  ) /_/ / /_/ / /__/  __/ /_/ /_/ / /    
-/____/ .___/\__,_/\___/\___/\__/\__,_/_/     
-    /_/                                      
-"""
+_pragmas = ["journal_mode = OFF", "synchronous = OFF", "temp_store = MEMORY"]
+_saturable = {"C", "H", "O", "N", "F", "Cl", "Br", "I", "At", "Te"}
+_gaps = re.compile(r"[\s,:]*")
+
+
+def _elements(formula: typing.Optional[str]) -> typing.Dict:
+
+    """"""
+
+    if formula:
+        return {
+            symbols[Z - 1]: natoms
+            for (
+                Z,
+                natoms,
+            ) in composition(formula).items()
+            if Z != 0
+        }
+    else:
+        return {}
+
+
+def _derived(
+    formula: typing.Optional[str],
+    A: typing.Optional[float] = None,
+    B: typing.Optional[float] = None,
+    C: typing.Optional[float] = None,
+) -> typing.Dict:
+
+    """"""
+
+    composed = composition(formula) if formula else {}
+    elements = {symbols[Z - 1]: natom for Z, natom in composed.items() if Z != 0}
+
+    charge = composed.get(0, 0)
+    nelectrons = sum([Z * natom for Z, natom in composed.items()]) - charge
+
+    if any(_ not in _saturable for _ in elements):
+        unsaturation = None
+    else:
+        unsaturation = 1 + 0.5 * (
+            elements.get("H", 0) * -1
+            + elements.get("C", 0) * 2
+            + elements.get("N", 0) * 1
+            + elements.get("Cl", 0) * -1
+            + elements.get("F", 0) * -1
+        )
+
+    if any(_ is not None for _ in [A, B, C]):
+        if A is None and C is None:
+            kappa: typing.Optional[float] = -1
+        else:
+            over = (2 * _nullnum(B)) - _nullnum(A) - _nullnum(C)
+            under = _nullnum(A) - _nullnum(C)
+            kappa = over / under
+    else:
+        kappa = None
+
+    return {
+        "mass": molecular_mass(composed) if formula else 0.0,
+        "charge": charge,
+        "natoms": sum(elements.values()),
+        "nelectrons": nelectrons,
+        "neutral": charge == 0,
+        "cation": charge > 0,
+        "anion": charge < 0,
+        "radical": (nelectrons % 2) != 0,
+        "unsaturation": unsaturation,
+        "kappa": kappa,
+    }
+
 
 Base = orm.declarative_base()
-Engine = sql.create_engine(f"sqlite:///{_database}", future=True)
+
+
+class Connections:
+
+    """"""
+
+    def __init__(
+        self,
+        database: typing.Optional[pathlib.Path] = None,
+        readonly: bool = True,
+        immutable: bool = False,
+        size: int = 8,
+        overflow: int = 8,
+        timeout: float = 30.0,
+        threaded: bool = False,
+    ):
+        self._lock = threading.Lock()
+        self._engine: typing.Optional[sql.engine.Engine] = None
+        self.settings: typing.Dict[str, typing.Any] = {
+            "database": pathlib.Path(database or _database),
+            "readonly": readonly,
+            "immutable": immutable,
+            "size": size,
+            "overflow": overflow,
+            "timeout": timeout,
+            "threaded": threaded,
+        }
+
+    def __str__(self) -> str:
+        return f"<Connections | {self.url} | {self.status()}>"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    @property
+    def database(self) -> pathlib.Path:
+        return self.settings["database"]
+
+    @property
+    def url(self) -> str:
+        options = []
+        if self.settings["readonly"]:
+            options.append("mode=ro")
+        if self.settings["immutable"]:
+            options.append("immutable=1")
+        options.append("uri=true")
+        return f"sqlite:///{self.database.resolve().as_uri()}?{'&'.join(options)}"
+
+    @property
+    def engine(self) -> sql.engine.Engine:
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    self._engine = self.create()
+        return self._engine
+
+    def create(self) -> sql.engine.Engine:
+
+        """"""
+
+        settings = self.settings
+        options: typing.Dict[str, typing.Any] = (
+            {
+                "poolclass": pool.SingletonThreadPool,
+                "pool_size": settings["size"],
+            }
+            if settings["threaded"]
+            else {
+                "poolclass": pool.QueuePool,
+                "pool_size": settings["size"],
+                "max_overflow": settings["overflow"],
+                "pool_timeout": settings["timeout"],
+                "pool_use_lifo": True,
+            }
+        )
+        return sql.create_engine(
+            self.url,
+            future=True,
+            connect_args={
+                "check_same_thread": False,
+                "timeout": settings["timeout"],
+            },
+            **options,
+        )
+
+    def configure(self, **settings: typing.Any) -> "Connections":
+
+        """"""
+
+        unknown = set(settings) - set(self.settings)
+        if unknown:
+            raise ValueError(
+                f"Unknown connection setting(s): {', '.join(sorted(unknown))}."
+            )
+        with self._lock:
+            self.settings.update(settings)
+            if "database" in settings:
+                self.settings["database"] = pathlib.Path(settings["database"])
+            engine, self._engine = self._engine, None
+        if engine is not None:
+            engine.dispose()
+        return self
+
+    def connect(self) -> sql.engine.Connection:
+
+        """"""
+
+        return self.engine.connect()
+
+    def session(self) -> orm.Session:
+
+        """"""
+
+        return orm.Session(self.engine, future=True)
+
+    def dispose(self) -> None:
+
+        """"""
+
+        if self._engine is not None:
+            self._engine.dispose()
+
+    def status(self) -> str:
+
+        """"""
+
+        return "not connected" if self._engine is None else self._engine.pool.status()
+
+
+connections = Connections()
+
+
+assoc_mol_src = sql.Table(
+    "assoc_mol_src",
+    Base.metadata,
+    sql.Column("id", sql.Integer, primary_key=True),
+    sql.Column(
+        "mol_id",
+        sql.Integer,
+        sql.ForeignKey("molecules.id"),
+    ),
+    sql.Column(
+        "src_id",
+        sql.Integer,
+        sql.ForeignKey("sources.id"),
+    ),
+    sql.Index("ix_assoc_mol_src_mol_id", "mol_id", "id", "src_id"),
+    sql.Index("ix_assoc_mol_src_src_id", "src_id", "id", "mol_id"),
+)
+
+assoc_mol_tel = sql.Table(
+    "assoc_mol_tel",
+    Base.metadata,
+    sql.Column("id", sql.Integer, primary_key=True),
+    sql.Column(
+        "mol_id",
+        sql.Integer,
+        sql.ForeignKey("molecules.id"),
+    ),
+    sql.Column(
+        "tel_id",
+        sql.Integer,
+        sql.ForeignKey("telescopes.id"),
+    ),
+    sql.Index("ix_assoc_mol_tel_mol_id", "mol_id", "id", "tel_id"),
+    sql.Index("ix_assoc_mol_tel_tel_id", "tel_id", "id", "mol_id"),
+)
+
+assoc_mol_wave = sql.Table(
+    "assoc_mol_wave",
+    Base.metadata,
+    sql.Column("id", sql.Integer, primary_key=True),
+    sql.Column(
+        "mol_id",
+        sql.Integer,
+        sql.ForeignKey("molecules.id"),
+    ),
+    sql.Column(
+        "wave_id",
+        sql.Integer,
+        sql.ForeignKey("wavelengths.id"),
+    ),
+    sql.Index("ix_assoc_mol_wave_mol_id", "mol_id", "id", "wave_id"),
+    sql.Index("ix_assoc_mol_wave_wave_id", "wave_id", "id", "mol_id"),
+)
+
+assoc_tel_wave = sql.Table(
+    "assoc_tel_wave",
+    Base.metadata,
+    sql.Column("id", sql.Integer, primary_key=True),
+    sql.Column(
+        "tel_id",
+        sql.Integer,
+        sql.ForeignKey("telescopes.id"),
+    ),
+    sql.Column(
+        "wave_id",
+        sql.Integer,
+        sql.ForeignKey("wavelengths.id"),
+    ),
+    sql.Index("ix_assoc_tel_wave_tel_id", "tel_id", "id", "wave_id"),
+    sql.Index("ix_assoc_tel_wave_wave_id", "wave_id", "id", "tel_id"),
+)
+
+hashes = sql.Table(
+    "hashes",
+    Base.metadata,
+    sql.Column("kind", sql.String(50), primary_key=True),
+    sql.Column("key", sql.String(50), primary_key=True),
+    sql.Column("digest", sql.String(64), nullable=False),
+)
 
 
 class Molecule(Base):
@@ -41,67 +321,43 @@ class Molecule(Base):
 
     id = sql.Column(sql.Integer, primary_key=True)
     label = sql.Column(sql.String(50), unique=True, nullable=False)
-    name = sql.Column(sql.String(50), nullable=False)
-    formula = sql.Column(sql.String(50), nullable=False)
-    year = sql.Column(sql.Integer)
+    name = sql.Column(sql.String(50), nullable=False, index=True)
+    formula = sql.Column(sql.String(50), nullable=False, index=True)
+    year = sql.Column(sql.Integer, index=True)
 
     sources: typing.List["Source"] = orm.relationship(
         "Source",
-        secondary=sql.Table(
-            "assoc_mol_src",
-            Base.metadata,
-            sql.Column(
-                "mol_id",
-                sql.Integer,
-                sql.ForeignKey("molecules.id"),
-            ),
-            sql.Column(
-                "src_id",
-                sql.Integer,
-                sql.ForeignKey("sources.id"),
-            ),
+        secondary=assoc_mol_src,
+        order_by=assoc_mol_src.c.id,
+        backref=orm.backref(
+            "molecules",
+            lazy="select",
+            order_by=assoc_mol_src.c.id,
         ),
-        backref=orm.backref("molecules", lazy="selectin"),
         lazy="selectin",
     )
 
     telescopes: typing.List["Telescope"] = orm.relationship(
         "Telescope",
-        secondary=sql.Table(
-            "assoc_mol_tel",
-            Base.metadata,
-            sql.Column(
-                "mol_id",
-                sql.Integer,
-                sql.ForeignKey("molecules.id"),
-            ),
-            sql.Column(
-                "tel_id",
-                sql.Integer,
-                sql.ForeignKey("telescopes.id"),
-            ),
+        secondary=assoc_mol_tel,
+        order_by=assoc_mol_tel.c.id,
+        backref=orm.backref(
+            "molecules",
+            lazy="select",
+            order_by=assoc_mol_tel.c.id,
         ),
-        backref=orm.backref("molecules", lazy="selectin"),
         lazy="selectin",
     )
 
     wavelengths: typing.List["Wavelength"] = orm.relationship(
         "Wavelength",
-        sql.Table(
-            "assoc_mol_wave",
-            Base.metadata,
-            sql.Column(
-                "mol_id",
-                sql.Integer,
-                sql.ForeignKey("molecules.id"),
-            ),
-            sql.Column(
-                "wave_id",
-                sql.Integer,
-                sql.ForeignKey("wavelengths.id"),
-            ),
+        assoc_mol_wave,
+        order_by=assoc_mol_wave.c.id,
+        backref=orm.backref(
+            "molecules",
+            lazy="select",
+            order_by=assoc_mol_wave.c.id,
         ),
-        backref=orm.backref("molecules", lazy="selectin"),
         lazy="selectin",
     )
 
@@ -133,6 +389,30 @@ class Molecule(Base):
 
     notes = sql.Column(sql.String(500))
 
+    mass = sql.Column(sql.Float, index=True)
+    charge = sql.Column(sql.Integer, index=True)
+    natoms = sql.Column(sql.Integer, index=True)
+    nelectrons = sql.Column(sql.Integer, index=True)
+    neutral = sql.Column(sql.Boolean, index=True)
+    cation = sql.Column(sql.Boolean, index=True)
+    anion = sql.Column(sql.Boolean, index=True)
+    radical = sql.Column(sql.Boolean, index=True)
+    unsaturation = sql.Column(sql.Float, index=True)
+    kappa = sql.Column(sql.Float, index=True)
+
+    def __init__(self, **kwargs):
+        super().__init__(
+            **{
+                **_derived(
+                    kwargs.get("formula"),
+                    kwargs.get("A"),
+                    kwargs.get("B"),
+                    kwargs.get("C"),
+                ),
+                **kwargs,
+            }
+        )
+
     def __str__(self) -> str:
         return f"<Molecule: {self.formula} ({self.name})>"
 
@@ -156,144 +436,6 @@ class Molecule(Base):
         else:
             return {}
 
-    @property
-    def natoms(self):
-
-        """"""
-
-        return sum([natom for natom in self.composition.values()])
-
-    @property
-    def nelectrons(self):
-
-        """"""
-
-        return (
-            sum(
-                [
-                    Z * natom
-                    for (
-                        Z,
-                        natom,
-                    ) in composition(self.formula).items()
-                ]
-            )
-            - self.charge
-        )
-
-    @property
-    def mass(self) -> float:
-
-        """"""
-
-        if self.formula:
-            return molecular_mass(composition(self.formula))
-        else:
-            return 0.0
-
-    @property
-    def charge(self) -> int:
-
-        """"""
-
-        if self.formula:
-            return composition(self.formula).get(0, 0)
-        else:
-            return 0
-
-    @property
-    def neutral(self) -> bool:
-
-        """"""
-
-        if self.charge == 0:
-            return True
-        else:
-            return False
-
-    @property
-    def cation(self):
-
-        """"""
-
-        if not self.neutral and (self.charge > 0):
-            return True
-        else:
-            return False
-
-    @property
-    def anion(self):
-
-        """"""
-
-        if not self.neutral and (self.charge < 0):
-            return True
-        else:
-            return False
-
-    @property
-    def radical(self):
-
-        """"""
-
-        if (self.nelectrons % 2) == 0:
-            return False
-        else:
-            return True
-
-    @property
-    def unsaturation(self):
-
-        """"""
-
-        for key in self.composition.keys():
-            if key in (
-                set(symbols)
-                ^ {
-                    "C",
-                    "H",
-                    "O",
-                    "N",
-                    "F",
-                    "Cl",
-                    "Br",
-                    "I",
-                    "At",
-                    "Te",
-                }
-            ):
-                return None
-        else:
-            return 1 + 0.5 * (
-                self.composition.get("H", 0) * -1
-                + self.composition.get("C", 0) * 2
-                + self.composition.get("N", 0) * 1
-                + self.composition.get("Cl", 0) * -1
-                + self.composition.get("F", 0) * -1
-            )
-
-    @property
-    def kappa(self) -> typing.Optional[float]:
-
-        """"""
-
-        if any(
-            _ is not None
-            for _ in [
-                self.A,
-                self.B,
-                self.C,
-            ]
-        ):
-            if self.A == None and self.C == None:
-                return -1
-            else:
-                over = (2 * _nullnum(self.B)) - _nullnum(self.A) - _nullnum(self.C)
-                under = _nullnum(self.A) - _nullnum(self.C)
-                return over / under
-        else:
-            return None
-
 
 class Source(Base):
 
@@ -303,26 +445,26 @@ class Source(Base):
 
     id = sql.Column(sql.Integer, primary_key=True)
     name = sql.Column(sql.String(50), unique=True)
-    kind = sql.Column(sql.String(50))
+    kind = sql.Column(sql.String(50), index=True)
     ra = sql.Column(sql.String(50))
     dec = sql.Column(sql.String(50))
     exgal = sql.Column(sql.Boolean)
     exo = sql.Column(sql.Boolean)
     simbad_url = sql.Column(sql.String(500))
 
+    detects = orm.column_property(
+        sql.select(sql.func.count())
+        .where(assoc_mol_src.c.src_id == id)
+        .correlate_except(assoc_mol_src)
+        .scalar_subquery()
+    )
+
     def __str__(self) -> str:
         return f"<Source: {self.name}>"
 
     def __repr__(self) -> str:
         return str(self)
 
-    @property
-    def detects(self):
-
-        """"""
-
-        return len(self.molecules)
-
 
 class Telescope(Base):
 
@@ -333,24 +475,12 @@ class Telescope(Base):
     id = sql.Column(sql.Integer, primary_key=True)
     name = sql.Column(sql.String(50), unique=True)
     nick = sql.Column(sql.String(50), unique=True)
-    kind = sql.Column(sql.String(50))
+    kind = sql.Column(sql.String(50), index=True)
     wavelengths: typing.List["Wavelength"] = orm.relationship(
         "Wavelength",
-        sql.Table(
-            "assoc_tel_wave",
-            Base.metadata,
-            sql.Column(
-                "tel_id",
-                sql.Integer,
-                sql.ForeignKey("telescopes.id"),
-            ),
-            sql.Column(
-                "wave_id",
-                sql.Integer,
-                sql.ForeignKey("wavelengths.id"),
-            ),
-        ),
-        backref="telescopes",
+        assoc_tel_wave,
+        order_by=assoc_tel_wave.c.id,
+        backref=orm.backref("telescopes", order_by=assoc_tel_wave.c.id),
         lazy="selectin",
     )
     latitude = sql.Column(sql.Float)
@@ -360,19 +490,19 @@ class Telescope(Base):
     decommissioned = sql.Column(sql.Integer)
     notes = sql.Column(sql.String(500))
 
+    detects = orm.column_property(
+        sql.select(sql.func.count())
+        .where(assoc_mol_tel.c.tel_id == id)
+        .correlate_except(assoc_mol_tel)
+        .scalar_subquery()
+    )
+
     def __str__(self) -> str:
         return f"<Telescope: {self.name}>"
 
     def __repr__(self) -> str:
         return str(self)
 
-    @property
-    def detects(self):
-
-        """"""
-
-        return len(self.molecules)
-
 
 class Wavelength(Base):
 
@@ -393,199 +523,549 @@ class Wavelength(Base):
         return f"{self.name}"
 
 
-def _create_database():
+fulltext = sql.Table(
+    "fulltext",
+    sql.MetaData(),
+    sql.Column("entity", sql.String(50)),
+    sql.Column("ref", sql.Integer),
+    sql.Column("name", sql.String(500)),
+    sql.Column("alias", sql.String(500)),
+    sql.Column("category", sql.String(500)),
+    sql.Column("formula", sql.String(500)),
+    sql.Column("notes", sql.String(500)),
+    sql.Column("refs", sql.String(1000)),
+)
+
+sql.event.listen(
+    Base.metadata,
+    "after_create",
+    sql.DDL(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS fulltext USING fts5(
+            entity UNINDEXED,
+            ref UNINDEXED,
+            name,
+            alias,
+            category,
+            formula,
+            notes,
+            refs,
+            tokenize = "unicode61 tokenchars '+-'",
+            prefix = '2 3'
+        )
+        """
+    ),
+)
+
+
+def _index_text(connection: sql.engine.Connection) -> int:
+
+    """"""
+
+    mols = Molecule.__table__.c
+    srcs = Source.__table__.c
+    tels = Telescope.__table__.c
+
+    connection.execute(sql.delete(fulltext))
+    for entity, select in [
+        (
+            "molecules",
+            sql.select(
+                mols.id,
+                mols.name,
+                mols.label,
+                sql.null(),
+                mols.formula,
+                mols.notes,
+                sql.func.coalesce(mols.ism_refs, "")
+                + " "
+                + sql.func.coalesce(mols.lab_refs, ""),
+            ),
+        ),
+        (
+            "sources",
+            sql.select(srcs.id, srcs.name, sql.null(), srcs.kind, *[sql.null()] * 3),
+        ),
+        (
+            "telescopes",
+            sql.select(tels.id, tels.name, tels.nick, *[sql.null()] * 4),
+        ),
+    ]:
+        connection.execute(
+            fulltext.insert().from_select(
+                [_.name for _ in fulltext.c],
+                sql.select(sql.literal(entity), *select.selected_columns),
+            )
+        )
+    return connection.execute(
+        sql.select(sql.func.count()).select_from(fulltext)
+    ).scalar_one()
+
+
+def _stamp() -> typing.Tuple:
 
     """"""
 
-    from rich.progress import track
+    database = connections.database
+    try:
+        stat = database.stat()
+    except FileNotFoundError:
+        return (str(database),)
+    return (str(database), stat.st_mtime_ns, stat.st_size)
 
-    _database.unlink(missing_ok=True)
 
-    Base.metadata.create_all(Engine)
+def _ids(names: typing.Iterable[str], ids: typing.Dict) -> typing.List[int]:
 
-    with orm.Session(Engine) as session:
+    """"""
 
-        for _ in track(
-            _bands,
-            description="[i][u]Storing wavelength bands: ",
-        ):
-            wavelength = Wavelength(name=_)
-            session.add(wavelength)
-            session.commit()
+    return [ids[name] for name in names if name in ids]
 
-        for _ in track(
-            _raw("galactic").values(),
-            description="[i][u]Storing galactic sources: ",
-        ):
 
-            source = Source(
-                name=_["name"],
-                kind=_["kind"],
-                ra=_["ra"],
-                dec=_["dec"],
-                exgal=False,
-                exo=False,
-                simbad_url=_["simbad_url"],
-            )
-            session.add(source)
-            session.commit()
-
-        for _ in track(
-            _raw("extragalactic").values(),
-            description="[i][u]Storing extragalactic sources: ",
-        ):
-
-            source = Source(
-                name=_["name"],
-                kind=_["kind"],
-                ra=_["ra"],
-                dec=_["dec"],
-                exgal=True,
-                exo=False,
-                simbad_url=_["simbad_url"],
-            )
-            session.add(source)
-            session.commit()
-
-        for _ in track(
-            _raw("exoplanets").values(),
-            description="[i][u]Storing exoplanetary sources: ",
-        ):
-
-            source = Source(
-                name=_["name"],
-                kind=_["kind"],
-                ra=_["ra"],
-                dec=_["dec"],
-                exgal=False,
-                exo=True,
-                simbad_url=_["simbad_url"],
-            )
-            session.add(source)
-            session.commit()
-
-        for _ in track(
-            _raw("telescopes").values(),
-            description="[i][u]Storing telescopes: ",
-        ):
-            telescope = Telescope(
-                name=_["name"],
-                nick=_["nick"],
-                kind=_["kind"],
-                latitude=_["latitude"],
-                longitude=_["longitude"],
-                diameter=_["diameter"],
-                built=_["built"],
-                decommissioned=_["decommissioned"],
-                notes=_["notes"],
-            )
+def _digest(record: typing.Dict) -> str:
+
+    """"""
+
+    return hashlib.sha1(
+        json.dumps(record, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def _source(record: typing.Dict) -> typing.Dict:
+
+    """"""
+
+    return {
+        "name": record["name"],
+        "kind": record["kind"],
+        "ra": record["ra"],
+        "dec": record["dec"],
+        "exgal": bool(record.get("exgal")),
+        "exo": bool(record.get("exo")),
+        "simbad_url": record["simbad_url"],
+    }
+
+
+def _telescope(record: typing.Dict) -> typing.Dict:
+
+    """"""
+
+    return {
+        "name": record["name"],
+        "nick": record["nick"],
+        "kind": record["kind"],
+        "latitude": record["latitude"],
+        "longitude": record["longitude"],
+        "diameter": record["diameter"],
+        "built": record["built"],
+        "decommissioned": record["decommissioned"],
+        "notes": record["notes"],
+    }
+
+
+def _molecule(record: typing.Dict) -> typing.Dict:
+
+    """"""
+
+    return {
+        "name": record["name"],
+        "formula": record["formula"],
+        "label": record["label"],
+        "year": record["year"],
+        "cyclic": record["cyclic"],
+        "fullerene": record["fullerene"],
+        "pah": record["pah"],
+        "mua": record["mua"],
+        "mub": record["mub"],
+        "muc": record["muc"],
+        "isos": record["isos"],
+        "isos_refs": record["isos_refs"],
+        "isos_lab_refs": record["isos_lab_refs"],
+        "ice": record["ice"],
+        "ppd": record["ppd"],
+        "exgal": record["exgal"],
+        "exgal_refs": record["exgal_refs"],
+        "exo": record["exo"],
+        "exo_refs": record["exo_refs"],
+        "notes": record["notes"],
+        "A": record["A"],
+        "B": record["B"],
+        "C": record["C"],
+        "ism_refs": record["ism_refs"],
+        "lab_refs": record["lab_refs"],
+        **_derived(record["formula"], record["A"], record["B"], record["C"]),
+    }
+
+
+def _links(record: typing.Dict) -> typing.Dict[str, typing.List[str]]:
+
+    """"""
 
-            for name in _["wavelengths"]:
-                wavelength = (
-                    session.query(Wavelength)
-                    .filter_by(
-                        name=name,
+    return {
+        "wavelengths": record["wavelengths"],
+        "sources": [
+            *record["sources"],
+            *re.split(_sep, str(record["exgal_sources"])),
+            *re.split(_sep, str(record["exo_sources"])),
+        ],
+        "telescopes": record["telescopes"],
+    }
+
+
+def _records(path: pathlib.Path, size: int = 1 << 16) -> typing.Iterator[typing.Dict]:
+
+    """"""
+
+    decoder = json.JSONDecoder()
+
+    with path.open(encoding="utf-8") as file:
+
+        if path.suffix == ".jsonl":
+            yield from (json.loads(line) for line in file if line.strip())
+            return
+
+        buffer, index, eof = "", 0, False
+        keyed: typing.Optional[bool] = None
+        key: typing.Optional[str] = None
+
+        def more():
+            nonlocal buffer, index, eof
+            chunk = file.read(size)
+            buffer, index, eof = buffer[index:] + chunk, 0, not chunk
+
+        while True:
+            gap = _gaps.match(buffer, index)
+            assert gap is not None
+            index = gap.end()
+            if index == len(buffer):
+                if eof:
+                    raise ValueError(f"{path} ends before its JSON is closed.")
+                more()
+                continue
+
+            if keyed is None:
+                if buffer[index] not in "{[":
+                    raise ValueError(f"{path} does not hold a JSON object or array.")
+                keyed, index = (buffer[index] == "{"), index + 1
+                continue
+
+            if buffer[index] in "}]":
+                return
+
+            try:
+                value, end = decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more()
+                continue
+
+            if (end == len(buffer)) and not eof:
+                more()
+                continue
+
+            index = end
+            if keyed and key is None:
+                key = value
+            else:
+                key = None
+                yield value
+
+
+def _create_database(
+    sources: typing.Optional[pathlib.Path] = None,
+    telescopes: typing.Optional[pathlib.Path] = None,
+    molecules: typing.Optional[pathlib.Path] = None,
+    batch: int = 1000,
+) -> typing.Dict:
+
+    """"""
+
+    from time import perf_counter
+    from rich.console import Console
+
+    console = Console()
+
+    connections.dispose()
+    connections.database.unlink(missing_ok=True)
+
+    builder = sql.create_engine(
+        sql.engine.URL.create("sqlite", database=str(connections.database)),
+        future=True,
+        poolclass=pool.NullPool,
+    )
+
+    Base.metadata.create_all(builder)
+
+    rows: typing.Dict[str, typing.List[typing.Dict]] = defaultdict(list)
+    stats: typing.Dict[str, int] = defaultdict(int)
+
+    start = perf_counter()
+    with console.status("[i][u]Storing wavelength bands...") as status:
+        with builder.connect() as connection:
+
+            for pragma in _pragmas:
+                connection.exec_driver_sql(f"PRAGMA {pragma}")
+            connection.commit()
+
+            def store(name: str, *records: typing.Dict, flush: bool = False):
+                rows[name].extend(records)
+                if rows[name] and (flush or len(rows[name]) >= batch):
+                    connection.execute(
+                        Base.metadata.tables[name].insert(),
+                        rows[name],
                     )
-                    .first()
-                )
-                if wavelength is not None:
-                    telescope.wavelengths.append(wavelength)
-
-            session.add(telescope)
-            session.commit()
-
-        for _ in track(
-            _raw("molecules").values(),
-            description="[i][u]Storing molecules: ",
-        ):
-            molecule = Molecule(
-                name=_["name"],
-                formula=_["formula"],
-                label=_["label"],
-                year=_["year"],
-                cyclic=_["cyclic"],
-                fullerene=_["fullerene"],
-                pah=_["pah"],
-                mua=_["mua"],
-                mub=_["mub"],
-                muc=_["muc"],
-                isos=_["isos"],
-                isos_refs=_["isos_refs"],
-                isos_lab_refs=_["isos_lab_refs"],
-                ice=_["ice"],
-                ppd=_["ppd"],
-                exgal=_["exgal"],
-                exgal_refs=_["exgal_refs"],
-                exo=_["exo"],
-                exo_refs=_["exo_refs"],
-                notes=_["notes"],
-                A=_["A"],
-                B=_["B"],
-                C=_["C"],
-                ism_refs=_["ism_refs"],
-                lab_refs=_["lab_refs"],
+                    stats[name] += len(rows[name])
+                    rows[name].clear()
+
+            waves = {name: id for id, name in enumerate(_bands, start=1)}
+            store(
+                "wavelengths",
+                *[{"id": id, "name": name} for name, id in waves.items()],
             )
 
-            for name in _["wavelengths"]:
-                wavelength = (
-                    session.query(Wavelength)
-                    .filter_by(
-                        name=name,
-                    )
-                    .first()
+            status.update("[i][u]Storing sources...")
+            srcs: typing.Dict[str, int] = {}
+            for _ in _records(sources or (_data / "sources.json")):
+                row = _source(_)
+                stats[
+                    "exoplanets"
+                    if row["exo"]
+                    else ("extragalactic" if row["exgal"] else "galactic")
+                ] += 1
+                srcs[row["name"]] = len(srcs) + 1
+                store("sources", {"id": srcs[row["name"]], **row})
+                store(
+                    "hashes",
+                    {"kind": "sources", "key": row["name"], "digest": _digest(_)},
                 )
-                if wavelength is not None:
-                    molecule.wavelengths.append(wavelength)
-
-            for name in _["sources"]:
-                source = (
-                    session.query(Source)
-                    .filter_by(
-                        name=name,
-                    )
-                    .first()
+
+            status.update("[i][u]Storing telescopes...")
+            tels: typing.Dict[str, int] = {}
+            for _ in _records(telescopes or (_data / "telescopes.json")):
+                row = _telescope(_)
+                tels[row["name"]] = len(tels) + 1
+                store("telescopes", {"id": tels[row["name"]], **row})
+                store(
+                    "assoc_tel_wave",
+                    *[
+                        {"tel_id": tels[row["name"]], "wave_id": id}
+                        for id in _ids(_["wavelengths"], waves)
+                    ],
+                )
+                store(
+                    "hashes",
+                    {"kind": "telescopes", "key": row["name"], "digest": _digest(_)},
                 )
-                if source is not None:
-                    molecule.sources.append(source)
 
-            for name in re.split(
-                _sep,
-                str(_["exgal_sources"]),
+            status.update("[i][u]Storing molecules...")
+            for id, _ in enumerate(
+                _records(molecules or (_data / "molecules.json")),
+                start=1,
             ):
-                source = (
-                    session.query(Source)
-                    .filter_by(
-                        name=name,
-                    )
-                    .first()
+                links = _links(_)
+                store("molecules", {"id": id, **_molecule(_)})
+                store(
+                    "assoc_mol_wave",
+                    *[
+                        {"mol_id": id, "wave_id": wave_id}
+                        for wave_id in _ids(links["wavelengths"], waves)
+                    ],
+                )
+                store(
+                    "assoc_mol_src",
+                    *[
+                        {"mol_id": id, "src_id": src_id}
+                        for src_id in _ids(links["sources"], srcs)
+                    ],
+                )
+                store(
+                    "assoc_mol_tel",
+                    *[
+                        {"mol_id": id, "tel_id": tel_id}
+                        for tel_id in _ids(links["telescopes"], tels)
+                    ],
+                )
+                store(
+                    "hashes",
+                    {"kind": "molecules", "key": _["label"], "digest": _digest(_)},
                 )
-                if source is not None:
-                    molecule.sources.append(source)
 
-            for name in re.split(
-                _sep,
-                str(_["exo_sources"]),
-            ):
-                source = (
-                    session.query(Source)
-                    .filter_by(
-                        name=name,
-                    )
-                    .first()
+            for table in Base.metadata.sorted_tables:
+                store(table.name, flush=True)
+
+            status.update("[i][u]Indexing text...")
+            stats["fulltext"] = _index_text(connection)
+            connection.commit()
+
+    elapsed = perf_counter() - start
+    builder.dispose()
+
+    total = sum([stats[table.name] for table in Base.metadata.sorted_tables])
+    rate = total / max(elapsed, 1e-9)
+
+    console.print(
+        f"[b]Stored[/] {total} rows in {elapsed:.3f} s "
+        f"([b]{rate:,.0f}[/] rows/s): "
+        + ", ".join([f"{name} ({count})" for name, count in stats.items()])
+    )
+
+    connections.dispose()
+    return {**stats, "total": total, "seconds": elapsed, "rate": rate}
+
+
+def _sync_database(
+    sources: typing.Optional[pathlib.Path] = None,
+    telescopes: typing.Optional[pathlib.Path] = None,
+    molecules: typing.Optional[pathlib.Path] = None,
+) -> typing.Dict[str, typing.Dict[str, typing.List[str]]]:
+
+    """"""
+
+    changes: typing.Dict[str, typing.Dict[str, typing.List[str]]] = {
+        kind: {"added": [], "updated": [], "removed": [], "relinked": []}
+        for kind in ["sources", "telescopes", "molecules"]
+    }
+
+    syncer = sql.create_engine(
+        sql.engine.URL.create("sqlite", database=str(connections.database)),
+        future=True,
+        poolclass=pool.NullPool,
+    )
+
+    Base.metadata.create_all(syncer)
+
+    with syncer.begin() as connection:
+
+        digests = {
+            (kind, key): digest
+            for kind, key, digest in connection.execute(sql.select(hashes))
+        }
+
+        ids = {
+            kind: {
+                key: id
+                for id, key in connection.execute(
+                    sql.select(table.c.id, getattr(table.c, column))
                 )
-                if source is not None:
-                    molecule.sources.append(source)
-
-            for name in _["telescopes"]:
-                telescope = (
-                    session.query(Telescope)
-                    .filter_by(
-                        name=name,
+            }
+            for kind, table, column in [
+                ("wavelengths", Wavelength.__table__, "name"),
+                ("sources", Source.__table__, "name"),
+                ("telescopes", Telescope.__table__, "name"),
+                ("molecules", Molecule.__table__, "label"),
+            ]
+        }
+
+        def upsert(kind: str, key: str, row: typing.Dict, digest: str):
+            table = Base.metadata.tables[kind]
+            if key not in ids[kind]:
+                ids[kind][key] = connection.execute(
+                    table.insert().values(**row)
+                ).inserted_primary_key[0]
+                changes[kind]["added"].append(key)
+            elif digests.get((kind, key)) != digest:
+                connection.execute(
+                    table.update().where(table.c.id == ids[kind][key]).values(**row)
+                )
+                changes[kind]["updated"].append(key)
+            else:
+                return False
+            connection.execute(
+                sql.delete(hashes).where(hashes.c.kind == kind, hashes.c.key == key)
+            )
+            connection.execute(
+                hashes.insert().values(kind=kind, key=key, digest=digest)
+            )
+            return True
+
+        def relink(assoc: sql.Table, column: str, id: int, rows: typing.List):
+            connection.execute(sql.delete(assoc).where(assoc.c[column] == id))
+            if rows:
+                connection.execute(assoc.insert(), rows)
+
+        def remove(kind: str, seen: typing.Set[str], *links: typing.Tuple):
+            table = Base.metadata.tables[kind]
+            for key in sorted(set(ids[kind]) - seen):
+                for assoc, column in links:
+                    connection.execute(
+                        sql.delete(assoc).where(assoc.c[column] == ids[kind][key])
                     )
-                    .first()
+                connection.execute(
+                    sql.delete(table).where(table.c.id == ids[kind][key])
                 )
-                if telescope is not None:
-                    molecule.telescopes.append(telescope)
+                connection.execute(
+                    sql.delete(hashes).where(hashes.c.kind == kind, hashes.c.key == key)
+                )
+                changes[kind]["removed"].append(key)
+                del ids[kind][key]
+
+        seen: typing.Set[str] = set()
+        for _ in _records(sources or (_data / "sources.json")):
+            seen.add(_["name"])
+            upsert("sources", _["name"], _source(_), _digest(_))
+        remove("sources", seen, (assoc_mol_src, "src_id"))
+
+        seen = set()
+        for _ in _records(telescopes or (_data / "telescopes.json")):
+            seen.add(_["name"])
+            if upsert("telescopes", _["name"], _telescope(_), _digest(_)):
+                id = ids["telescopes"][_["name"]]
+                relink(
+                    assoc_tel_wave,
+                    "tel_id",
+                    id,
+                    [
+                        {"tel_id": id, "wave_id": wave_id}
+                        for wave_id in _ids(_["wavelengths"], ids["wavelengths"])
+                    ],
+                )
+        remove(
+            "telescopes",
+            seen,
+            (assoc_tel_wave, "tel_id"),
+            (assoc_mol_tel, "tel_id"),
+        )
+
+        fresh = {
+            *changes["sources"]["added"],
+            *changes["telescopes"]["added"],
+        }
+
+        seen = set()
+        for _ in _records(molecules or (_data / "molecules.json")):
+            seen.add(_["label"])
+            links = _links(_)
+            if not upsert("molecules", _["label"], _molecule(_), _digest(_)):
+                if fresh.isdisjoint([*links["sources"], *links["telescopes"]]):
+                    continue
+                changes["molecules"]["relinked"].append(_["label"])
+            id = ids["molecules"][_["label"]]
+            for assoc, column, kind in [
+                (assoc_mol_wave, "wave_id", "wavelengths"),
+                (assoc_mol_src, "src_id", "sources"),
+                (assoc_mol_tel, "tel_id", "telescopes"),
+            ]:
+                relink(
+                    assoc,
+                    "mol_id",
+                    id,
+                    [
+                        {"mol_id": id, column: other}
+                        for other in _ids(links[kind], ids[kind])
+                    ],
+                )
+        remove(
+            "molecules",
+            seen,
+            (assoc_mol_wave, "mol_id"),
+            (assoc_mol_src, "mol_id"),
+            (assoc_mol_tel, "mol_id"),
+        )
+
+        if any(keys for kind in changes.values() for keys in kind.values()):
+            _index_text(connection)
+
+    syncer.dispose()
 
-            session.add(molecule)
-            session.commit()
+    connections.dispose()
+    return changes
@@ -1,19 +1,14 @@
-from typing import List
 from textwrap import dedent
 from rich.table import Table
-from rich.box import MINIMAL
+from rich.segment import Segment
+from rich.box import Box, MINIMAL, HEAVY_HEAD
+from typing import Any, Dict, List, Tuple, Callable, Iterable, Iterator, Optional
 from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.console import Console, RenderGroup
+from rich.console import RenderGroup
 
-from .core import _data, __version__
 from .chimie import formula_to_unicode
-from .core import _logo, Molecule, Source, Telescope
-
-
-"""
-"""
-console = Console()
+from .core import Molecule, Source, Telescope
+from .screens import console, render_help, render_usage, render_version
 
 
 """
@@ -69,34 +64,132 @@ _decommissioned = lambda _: (
 )
 
 
-def render_help():
-
-    """"""
+_title = lambda kind, count, total, end="": (
+    dedent(
+        f"""
+        [u]Number of {kind}[/]:
+        [b]{count}[/]
+        out of a total of
+        [b]{total}[/]{end}
+        """
+    )
+    .replace("\n", " ")
+    .strip()
+)
 
-    console.print(_logo, style="bold", highlight=False)
+_tables: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "molecules": lambda _: dict(
+        expand=True,
+        show_lines=True,
+        title=_title("molecules", _, 240, "."),
+        title_style="bold",
+        caption=_copyright,
+        caption_style="bold",
+    ),
+    "sources": lambda _: dict(
+        padding=0,
+        expand=True,
+        show_lines=True,
+        title=_title("sources", _, 83, "."),
+        title_style="bold",
+        caption=_copyright,
+        caption_style="bold",
+    ),
+    "telescopes": lambda _: dict(
+        padding=0,
+        expand=True,
+        show_lines=True,
+        title=_title("telescopes", _, 46),
+        title_style="bold",
+        caption=_copyright,
+        caption_style="bold",
+    ),
+}
 
+_continued = Box(
+    "├─┼┤\n" "│ ││\n" "├─┼┤\n" "│ ││\n" "├─┼┤\n" "├─┼┤\n" "│ ││\n" "└─┴┘\n"
+)
 
-def render_usage(kind: str = "cli"):
+_columns: Dict[str, List[Tuple[str, Any, int]]] = {
+    "molecules": [
+        ("Space molecule", "left", 1),
+        ("Year discovered in", "center", 1),
+        ("ISM/CSM Source(s)", "left", 1),
+        ("Exoplanetary Source(s)", "left", 1),
+        ("Extragalactic Source(s)", "left", 1),
+        ("Telescope(s) detected by", "left", 1),
+        ("Wavelength band(s) detected in", "left", 1),
+    ],
+    "sources": [
+        ("Name", "center", 1),
+        ("Type of source", "center", 1),
+        ("Right Ascension", "center", 1),
+        ("Declination", "center", 1),
+        ("Number of Detections", "center", 1),
+        ("URL in the SIMBAD Database", "center", 2),
+    ],
+    "telescopes": [
+        ("Name", "center", 1),
+        ("Nick", "center", 1),
+        ("Type of telescope", "center", 1),
+        ("Operational Wavelength(s)", "center", 1),
+        ("Latitude", "center", 1),
+        ("Longitude", "center", 1),
+        ("Diameter", "center", 1),
+        ("Built in", "center", 1),
+        ("Decommissioned in", "center", 1),
+        ("Number of Detections", "center", 1),
+    ],
+}
+
+
+class _Trimmed:
 
     """"""
 
-    if kind not in ["cli", "python"]:
-        raise ValueError("There is no help for using spacetar this way. Exiting...")
+    def __init__(self, renderable: Any):
+        self.renderable = renderable
 
-    with console.pager(styles=True):
-        console.print(
-            Markdown(
-                (_data / f"{kind}_usage.md").read_text(encoding="utf-8"),
-                justify="full",
-            )
-        )
+    def __rich_console__(self, console, options):
+        lines = console.render_lines(self.renderable, options, pad=False)
+        for line in lines[:-1]:
+            yield from line
+            yield Segment.line()
 
 
-def render_version():
+def _stream(
+    kind: str,
+    entries: Iterable,
+    count: int,
+    row: Callable[[Any], List[str]],
+    chunk: int = 64,
+) -> Iterator:
 
     """"""
 
-    console.print(f"[b]Version[/]: [u]{__version__}[/]")
+    settings = _tables[kind](count)
+    title = settings.pop("title")
+    caption = settings.pop("caption")
+
+    def table(index: int) -> Table:
+        table = Table(
+            **settings,
+            title=title if index == 0 else None,
+            caption=caption if index + chunk >= count else None,
+            show_header=index == 0,
+            box=HEAVY_HEAD if index == 0 else _continued,
+        )
+        for name, justify, ratio in _columns[kind]:
+            table.add_column(name, justify=justify, ratio=ratio)
+        return table
+
+    current = table(0)
+    for index, entry in enumerate(entries):
+        if index and (index % chunk == 0):
+            yield _Trimmed(current)
+            current = table(index)
+        current.add_row(*row(entry))
+    yield current
 
 
 def summarize_molecule(molecule: Molecule):
@@ -169,54 +262,39 @@ def summarize_molecule(molecule: Molecule):
     )
 
 
-def tabulate_molecules(molecules: List[Molecule]):
+def _molecule_row(molecule: Molecule) -> List[str]:
 
     """"""
 
-    table = Table(
-        expand=True,
-        show_lines=True,
-        title=dedent(
+    return [
+        dedent(
             f"""
-            [u]Number of molecules[/]:
-            [b]{len(molecules)}[/]
-            out of a total of
-            [b]240[/].
+            [u]Formula[/]: [b]{formula_to_unicode(str(molecule.formula))}[/]
+            [u]Name[/]: [i]{molecule.name}[/]
+            [u]Type[/]: {_kindof(molecule)}
+            [u]Molecular mass[/]: {molecule.mass:.2f} a.m.u.
             """
-        )
-        .replace("\n", " ")
-        .strip(),
-        title_style="bold",
-        caption=_copyright,
-        caption_style="bold",
-    )
+        ).strip(),
+        f"{molecule.year:d}",
+        _bullets([_ for _ in molecule.sources if (not _.exgal and not _.exo)]),
+        _bullets([_ for _ in molecule.sources if (not _.exgal and _.exo)]),
+        _bullets([_ for _ in molecule.sources if (_.exgal and not _.exo)]),
+        _bullets(molecule.telescopes),
+        _bullets(molecule.wavelengths),
+    ]
 
-    table.add_column("Space molecule", justify="left")
-    table.add_column("Year discovered in", justify="center")
-    table.add_column("ISM/CSM Source(s)", justify="left")
-    table.add_column("Exoplanetary Source(s)", justify="left")
-    table.add_column("Extragalactic Source(s)", justify="left")
-    table.add_column("Telescope(s) detected by", justify="left")
-    table.add_column("Wavelength band(s) detected in", justify="left")
 
-    for molecule in molecules:
+def tabulate_molecules(molecules: List[Molecule]):
 
-        table.add_row(
-            dedent(
-                f"""
-                [u]Formula[/]: [b]{formula_to_unicode(str(molecule.formula))}[/]
-                [u]Name[/]: [i]{molecule.name}[/]
-                [u]Type[/]: {_kindof(molecule)}
-                [u]Molecular mass[/]: {molecule.mass:.2f} a.m.u.
-                """
-            ).strip(),
-            f"{molecule.year:d}",
-            _bullets([_ for _ in molecule.sources if (not _.exgal and not _.exo)]),
-            _bullets([_ for _ in molecule.sources if (not _.exgal and _.exo)]),
-            _bullets([_ for _ in molecule.sources if (_.exgal and not _.exo)]),
-            _bullets(molecule.telescopes),
-            _bullets(molecule.wavelengths),
-        )
+    """"""
+
+    table = Table(**_tables["molecules"](len(molecules)))
+
+    for name, justify, _ in _columns["molecules"]:
+        table.add_column(name, justify=justify)
+
+    for molecule in molecules:
+        table.add_row(*_molecule_row(molecule))
 
     return table
 
@@ -248,48 +326,31 @@ def summarize_source(source: Source):
     )
 
 
+def _source_row(source: Source) -> List[str]:
+
+    """"""
+
+    return [
+        f"{source.name}",
+        f"{source.kind}",
+        f"{source.ra}",
+        f"{source.dec}",
+        f"{source.detects:d}",
+        f"{source.simbad_url}",
+    ]
+
+
 def tabulate_sources(sources: List[Source]):
 
     """"""
 
-    table = Table(
-        padding=0,
-        expand=True,
-        show_lines=True,
-        title=dedent(
-            f"""
-            [u]Number of sources[/]:
-            [b]{len(sources)}[/]
-            out of a total of
-            [b]83[/].
-            """
-        )
-        .replace("\n", " ")
-        .strip(),
-        title_style="bold",
-        caption=_copyright,
-        caption_style="bold",
-    )
+    table = Table(**_tables["sources"](len(sources)))
 
-    for name in [
-        "Name",
-        "Type of source",
-        "Right Ascension",
-        "Declination",
-        "Number of Detections",
-        "URL in the SIMBAD Database",
-    ]:
-        table.add_column(name, justify="center")
+    for name, justify, _ in _columns["sources"]:
+        table.add_column(name, justify=justify)
 
     for source in sources:
-        table.add_row(
-            f"{source.name}",
-            f"{source.kind}",
-            f"{source.ra}",
-            f"{source.dec}",
-            f"{source.detects:d}",
-            f"{source.simbad_url}",
-        )
+        table.add_row(*_source_row(source))
     return table
 
 
@@ -340,54 +401,137 @@ def summarize_telescope(telescope: Telescope):
     )
 
 
+def _telescope_row(telescope: Telescope) -> List[str]:
+
+    """"""
+
+    return [
+        f"{telescope.name}",
+        f"{telescope.nick}",
+        f"{telescope.kind}",
+        _commas(telescope.wavelengths),
+        f"{telescope.latitude}",
+        f"{telescope.longitude}",
+        f"{telescope.diameter}",
+        f"{telescope.built}",
+        _decommissioned(telescope),
+        f"{telescope.detects}",
+    ]
+
+
 def tabulate_telescopes(telescopes: List[Telescope]):
 
     """"""
 
+    table = Table(**_tables["telescopes"](len(telescopes)))
+
+    for name, justify, _ in _columns["telescopes"]:
+        table.add_column(name, justify=justify)
+
+    for telescope in telescopes:
+        table.add_row(*_telescope_row(telescope))
+    return table
+
+
+def summarize_changes(changes: Dict):
+
+    """"""
+
     table = Table(
-        padding=0,
         expand=True,
         show_lines=True,
-        title=dedent(
-            f"""
-            [u]Number of telescopes[/]:
-            [b]{len(telescopes)}[/]
-            out of a total of
-            [b]46[/]
-            """
-        )
-        .replace("\n", " ")
-        .strip(),
+        title="[u]Changes to the database[/]",
         title_style="bold",
         caption=_copyright,
         caption_style="bold",
     )
 
-    for name in [
-        "Name",
-        "Nick",
-        "Type of telescope",
-        "Operational Wavelength(s)",
-        "Latitude",
-        "Longitude",
-        "Diameter",
-        "Built in",
-        "Decommissioned in",
-        "Number of Detections",
-    ]:
-        table.add_column(name, justify="center")
+    table.add_column("Table", justify="left")
+    for name in ["Added", "Updated", "Removed", "Relinked"]:
+        table.add_column(name, justify="left")
 
-    for telescope in telescopes:
+    for kind, changed in changes.items():
         table.add_row(
-            f"{telescope.name}",
-            f"{telescope.nick}",
-            f"{telescope.kind}",
-            _commas(telescope.wavelengths),
-            f"{telescope.latitude}",
-            f"{telescope.longitude}",
-            f"{telescope.diameter}",
-            f"{telescope.built}",
-            _decommissioned(telescope),
-            f"{telescope.detects}",
+            f"[b]{kind}[/]",
+            *[
+                "\n".join(
+                    [f"[b]{len(changed[_])}[/]"]
+                    + [f"[yellow]*[/] {__}" for __ in changed[_]]
+                )
+                for _ in ["added", "updated", "removed", "relinked"]
+            ],
         )
     return table
+
+
+def tabulate_matches(matches: List):
+
+    """"""
+
+    table = Table(
+        expand=True,
+        show_lines=True,
+        title=f"[u]Number of matches[/]: [b]{len(matches)}[/]",
+        title_style="bold",
+        caption=_copyright,
+        caption_style="bold",
+    )
+
+    table.add_column("Rank", justify="center")
+    table.add_column("Table", justify="center")
+    table.add_column("Match", justify="left")
+
+    for rank, match in enumerate(matches, start=1):
+        if match.entity == "molecules":
+            text = (
+                f"[b]{formula_to_unicode(str(match.formula))}[/] "
+                f"([i]{match.name}[/])"
+            )
+        elif match.entity == "sources":
+            text = f"[b]{match.name}[/] ([i]{match.category}[/])"
+        else:
+            text = f"[b]{match.name}[/] ([i]{match.alias}[/])"
+        table.add_row(f"{rank:d}", match.entity[:-1].capitalize(), text)
+    return table
+
+
+def stream_molecules(
+    molecules: Iterable[Molecule],
+    chunk: int = 64,
+    count: Optional[int] = None,
+) -> Iterator:
+
+    """"""
+
+    if count is None:
+        molecules = list(molecules)
+        count = len(molecules)
+    return _stream("molecules", molecules, count, _molecule_row, chunk)
+
+
+def stream_sources(
+    sources: Iterable[Source],
+    chunk: int = 64,
+    count: Optional[int] = None,
+) -> Iterator:
+
+    """"""
+
+    if count is None:
+        sources = list(sources)
+        count = len(sources)
+    return _stream("sources", sources, count, _source_row, chunk)
+
+
+def stream_telescopes(
+    telescopes: Iterable[Telescope],
+    chunk: int = 64,
+    count: Optional[int] = None,
+) -> Iterator:
+
+    """"""
+
+    if count is None:
+        telescopes = list(telescopes)
+        count = len(telescopes)
+    return _stream("telescopes", telescopes, count, _telescope_row, chunk)
@@ -0,0 +1,306 @@
+import csv
+import json
+import typing
+
+import sqlalchemy as sql
+
+from sqlalchemy.sql.selectable import Select
+
+from .core import connections
+from .records import _kinds
+
+
+_separator = "; "
+
+
+def fields(model: typing.Any) -> typing.List[str]:
+
+    """"""
+
+    return list(_kinds[model][0]._fields)
+
+
+def model_of(entry: typing.Any) -> typing.Any:
+
+    """"""
+
+    for model, (record, _, _) in _kinds.items():
+        if isinstance(entry, (model, record)):
+            return model
+    return {_.__tablename__: _ for _ in _kinds}[entry._table]
+
+
+def _links(model: typing.Any) -> typing.Dict[str, typing.Tuple]:
+
+    """"""
+
+    record, extras, links = _kinds[model]
+    names = record._fields[len(model.__table__.c) + len(extras) :]
+    return dict(zip(names, links))
+
+
+def _linked(model: typing.Any, link: typing.Tuple) -> typing.Any:
+
+    """"""
+
+    assoc, own, other, name = link
+    inner = (
+        sql.select(name.label("value"))
+        .join(name.table, name.table.c.id == assoc.c[other])
+        .where(assoc.c[own] == model.__table__.c.id)
+        .order_by(assoc.c.id)
+        .correlate(model.__table__)
+        .subquery()
+    )
+    return sql.select(sql.func.json_group_array(inner.c.value)).scalar_subquery()
+
+
+def export_query(
+    query: Select,
+    model: typing.Any,
+    fields: typing.Optional[typing.List[str]] = None,
+) -> Select:
+
+    """"""
+
+    record, extras, _ = _kinds[model]
+    fields = fields or list(record._fields)
+    unknown = [_ for _ in fields if _ not in record._fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s) for {model.__tablename__}: {', '.join(unknown)}. "
+            f"Choose from: {', '.join(record._fields)}."
+        )
+
+    links = _links(model)
+    extras = {_.key: _ for _ in extras}
+    columns = []
+    for field in fields:
+        if field in links:
+            column = _linked(model, links[field])
+        elif field in extras:
+            column = extras[field]
+        else:
+            column = model.__table__.c[field]
+        columns.append(column.label(field))
+    return query.with_only_columns(*columns)
+
+
+def schema(
+    model: typing.Any,
+    fields: typing.Optional[typing.List[str]] = None,
+) -> typing.Dict[str, type]:
+
+    """"""
+
+    links = _links(model)
+    return {
+        name: list if name in links else column.type.python_type
+        for name, column in export_query(
+            sql.select(model), model, fields
+        ).selected_columns.items()
+    }
+
+
+def rows(
+    query: Select,
+    model: typing.Any,
+    fields: typing.Optional[typing.List[str]] = None,
+    size: int = 512,
+) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+
+    """"""
+
+    projected = export_query(query, model, fields)
+    linked = [_ for _ in projected.selected_columns.keys() if _ in _links(model)]
+
+    with connections.connect() as connection:
+        result = connection.execution_options(stream_results=True).execute(projected)
+        for partition in result.mappings().partitions(size):
+            for row in partition:
+                row = dict(row)
+                for field in linked:
+                    row[field] = json.loads(row[field])
+                yield row
+
+
+def _unloaded(
+    entries: typing.List,
+    model: typing.Any,
+    fields: typing.List[str],
+    size: int = 500,
+) -> typing.Dict[str, typing.Dict[int, typing.List[str]]]:
+
+    """"""
+
+    links = _links(model)
+    missing = [
+        _
+        for _ in fields
+        if (_ in links) and any(_ in sql.inspect(entry).unloaded for entry in entries)
+    ]
+    found: typing.Dict[str, typing.Dict[int, typing.List[str]]] = {
+        _: {} for _ in missing
+    }
+    if not missing:
+        return found
+
+    ids = [_.id for _ in entries]
+    with connections.connect() as connection:
+        for start in range(0, len(ids), size):
+            for row in connection.execute(
+                sql.select(
+                    model.__table__.c.id,
+                    *[_linked(model, links[_]).label(_) for _ in missing],
+                ).where(model.__table__.c.id.in_(ids[start : start + size]))
+            ):
+                for field in missing:
+                    found[field][row.id] = json.loads(row._mapping[field])
+    return found
+
+
+def entries(
+    results: typing.Iterable,
+    model: typing.Any,
+    fields: typing.Optional[typing.List[str]] = None,
+) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+
+    """"""
+
+    links = _links(model)
+    fields = fields or list(_kinds[model][0]._fields)
+    results = list(results)
+    unloaded = _unloaded(
+        [_ for _ in results if isinstance(_, model)],
+        model,
+        fields,
+    )
+    for entry in results:
+        row = {}
+        for field in fields:
+            if (field in unloaded) and (entry.id in unloaded[field]):
+                row[field] = unloaded[field][entry.id]
+                continue
+            value = getattr(entry, field)
+            if field in links:
+                value = [
+                    _ if isinstance(_, str) else getattr(_, links[field][3].key)
+                    for _ in value
+                ]
+            row[field] = value
+        yield row
+
+
+def write_jsonl(
+    rows: typing.Iterable[typing.Dict[str, typing.Any]],
+    file: typing.TextIO,
+    schema: typing.Dict[str, type],
+) -> int:
+
+    """"""
+
+    count = 0
+    for row in rows:
+        file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def write_csv(
+    rows: typing.Iterable[typing.Dict[str, typing.Any]],
+    file: typing.TextIO,
+    schema: typing.Dict[str, type],
+) -> int:
+
+    """"""
+
+    count = 0
+    writer = csv.DictWriter(file, fieldnames=list(schema))
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(
+            {
+                key: _separator.join(value) if isinstance(value, list) else value
+                for key, value in row.items()
+            }
+        )
+        count += 1
+    return count
+
+
+def _pyarrow() -> typing.Tuple[typing.Any, typing.Any]:
+
+    """"""
+
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "Exporting to Parquet needs PyArrow. "
+            "Install it with `pip install spacetar[parquet]`."
+        )
+    return pa, pq
+
+
+def write_parquet(
+    rows: typing.Iterable[typing.Dict[str, typing.Any]],
+    file: typing.Any,
+    schema: typing.Dict[str, type],
+    size: int = 1024,
+) -> int:
+
+    """"""
+
+    pa, pq = _pyarrow()
+    types = {
+        int: pa.int64(),
+        str: pa.string(),
+        bool: pa.bool_(),
+        float: pa.float64(),
+        list: pa.list_(pa.string()),
+    }
+    arrow = pa.schema([(name, types[kind]) for name, kind in schema.items()])
+
+    count = 0
+    batch: typing.List[typing.Dict[str, typing.Any]] = []
+    with pq.ParquetWriter(file, arrow) as writer:
+        for row in rows:
+            batch.append(row)
+            count += 1
+            if len(batch) == size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=arrow))
+                batch.clear()
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=arrow))
+    return count
+
+
+def writer(format: str) -> typing.Callable[..., int]:
+
+    """"""
+
+    writers = {
+        "jsonl": write_jsonl,
+        "csv": write_csv,
+        "parquet": write_parquet,
+    }
+    if format not in writers:
+        raise ValueError(
+            f"Cannot export to {format!r}. Choose from: {', '.join(writers)}."
+        )
+    if format == "parquet":
+        _pyarrow()
+    return writers[format]
+
+
+def write(
+    rows: typing.Iterable[typing.Dict[str, typing.Any]],
+    file: typing.Any,
+    format: str,
+    schema: typing.Dict[str, type],
+) -> int:
+
+    """"""
+
+    return writer(format)(rows, file, schema)
@@ -0,0 +1,128 @@
+import re
+import typing
+import threading
+
+from collections import defaultdict
+
+import sqlalchemy as sql
+
+from . import core
+
+
+_words = re.compile(r"[^\w+-]+")
+
+
+class Match(typing.NamedTuple):
+
+    """"""
+
+    kind: str
+    name: str
+    text: str
+    score: float
+
+
+def trigrams(text: str) -> typing.Set[str]:
+
+    """"""
+
+    grams: typing.Set[str] = set()
+    for word in _words.split(text.lower()):
+        if word:
+            padded = f"  {word} "
+            grams.update([padded[_ : _ + 3] for _ in range(len(padded) - 2)])
+    return grams
+
+
+class TrigramIndex:
+
+    """"""
+
+    def __init__(self, entries: typing.Iterable[typing.Tuple[str, str, str]]):
+        self.entries: typing.List[typing.Tuple[str, str, str]] = []
+        self.sizes: typing.List[int] = []
+        self.postings: typing.Dict[str, typing.List[int]] = defaultdict(list)
+        for kind, name, text in dict.fromkeys(entries):
+            grams = trigrams(text)
+            if not grams:
+                continue
+            for gram in grams:
+                self.postings[gram].append(len(self.entries))
+            self.entries.append((kind, name, text))
+            self.sizes.append(len(grams))
+
+    def __str__(self) -> str:
+        return (
+            f"<TrigramIndex | entries: {len(self.entries)}, "
+            f"trigrams: {len(self.postings)}>"
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __len__(self) -> int:
+
+        """"""
+
+        return len(self.entries)
+
+    def top(
+        self,
+        text: str,
+        k: int = 5,
+        kind: typing.Optional[str] = None,
+        cutoff: float = 0.3,
+    ) -> typing.List[Match]:
+
+        """"""
+
+        grams = trigrams(text)
+        shared: typing.Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for index in self.postings.get(gram, []):
+                shared[index] += 1
+
+        best: typing.Dict[typing.Tuple[str, str], Match] = {}
+        for index, count in shared.items():
+            kindof, name, matched = self.entries[index]
+            if (kind is not None) and (kindof != kind):
+                continue
+            score = count / (len(grams) + self.sizes[index] - count)
+            if score < cutoff:
+                continue
+            if ((kindof, name) not in best) or (score > best[kindof, name].score):
+                best[kindof, name] = Match(kindof, name, matched, score)
+
+        return sorted(best.values(), key=lambda _: (-_.score, _.name))[:k]
+
+
+_cache: typing.Dict[str, typing.Any] = {"stamp": None, "index": None}
+_lock = threading.Lock()
+
+
+def fuzzy_index() -> TrigramIndex:
+
+    """"""
+
+    stamp = core._stamp()
+    with _lock:
+        if _cache["stamp"] != stamp:
+            mols = core.Molecule.__table__.c
+            srcs = core.Source.__table__.c
+            tels = core.Telescope.__table__.c
+            with core.connections.connect() as connection:
+                entries = [
+                    (kind, name, text)
+                    for kind, select in [
+                        ("molecules", sql.select(mols.name, mols.name)),
+                        ("molecules", sql.select(mols.name, mols.label)),
+                        ("sources", sql.select(srcs.name, srcs.name)),
+                        ("telescopes", sql.select(tels.name, tels.name)),
+                        ("telescopes", sql.select(tels.name, tels.nick)),
+                    ]
+                    for name, text in connection.execute(select)
+                    if (name is not None) and (text is not None)
+                ]
+            _cache["index"] = TrigramIndex(entries)
+            _cache["stamp"] = stamp
+        return _cache["index"]
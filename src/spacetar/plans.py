@@ -0,0 +1,165 @@
+import re
+import sys
+import sqlalchemy as sql
+
+from typing import Any, Callable, Dict, List, Tuple
+
+from .core import connections
+from .search import (
+    search_source,
+    search_molecule,
+    search_telescope,
+)
+
+
+_alias = re.compile(r"_\d+$")
+_binds = re.compile(r"\?(?:, \?)+")
+_scan = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+_large = [
+    "sources",
+    "molecules",
+    "telescopes",
+    "assoc_mol_src",
+    "assoc_mol_tel",
+    "assoc_mol_wave",
+    "assoc_tel_wave",
+]
+
+# Each shape lists the tables its outermost statement is expected to scan:
+# unfiltered listings, like=True and other unindexable filters (boolean
+# flags, link EXISTS, computed detects). Any other scan is a regression.
+shapes: List[Tuple[Callable, Dict[str, Any], Tuple[str, ...]]] = [
+    (search_molecule, {}, ("molecules",)),
+    (search_molecule, {"name": "acetone"}, ()),
+    (search_molecule, {"formula": "CH3COOH"}, ()),
+    (search_molecule, {"year": [1990, 2000]}, ()),
+    (search_molecule, {"source": "TMC-1"}, ("molecules",)),
+    (search_molecule, {"telescope": "IRAM"}, ("molecules",)),
+    (search_molecule, {"wavelength": "mm"}, ("molecules",)),
+    (search_molecule, {"neutral": True}, ()),
+    (search_molecule, {"cation": True}, ()),
+    (search_molecule, {"anion": True}, ()),
+    (search_molecule, {"radical": True}, ()),
+    (search_molecule, {"cyclic": True, "pah": False}, ("molecules",)),
+    (search_molecule, {"ice": True, "ppd": True}, ("molecules",)),
+    (search_molecule, {"exgal": True, "exo": False}, ("molecules",)),
+    (search_molecule, {"like": True, "name": "acid"}, ("molecules",)),
+    (search_source, {}, ("sources",)),
+    (search_source, {"name": "Sgr B2"}, ()),
+    (search_source, {"kind": "Dark Cloud"}, ()),
+    (search_source, {"detects": [4, 6]}, ("sources",)),
+    (search_source, {"like": True, "name": "B2"}, ("sources",)),
+    (search_telescope, {}, ("telescopes",)),
+    (search_telescope, {"name": "ALMA"}, ()),
+    (search_telescope, {"kind": "Single Dish"}, ()),
+    (search_telescope, {"wavelength": "UV"}, ("telescopes",)),
+    (search_telescope, {"diameter": [10.0, 40.0]}, ("telescopes",)),
+    (search_telescope, {"built": [1990, 2014]}, ("telescopes",)),
+    (search_telescope, {"decommissioned": [1970, 1990]}, ("telescopes",)),
+    (search_telescope, {"detects": [6, 10]}, ("telescopes",)),
+    (search_molecule, {"records": True}, ("molecules",)),
+    (search_molecule, {"records": True, "source": "TMC-1"}, ("molecules",)),
+    (search_source, {"records": True}, ("sources",)),
+    (search_telescope, {"records": True, "wavelength": "UV"}, ("telescopes",)),
+]
+
+
+def capture(function: Callable, **kwargs) -> List[Tuple[str, Any]]:
+
+    """"""
+
+    statements: List[Tuple[str, Any]] = []
+
+    def listener(connection, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sql.event.listen(connections.engine, "before_cursor_execute", listener)
+    try:
+        list(function(**{"cached": False, **kwargs}))
+    finally:
+        sql.event.remove(connections.engine, "before_cursor_execute", listener)
+    return statements
+
+
+def explain(statement: str, parameters: Any = ()) -> List[Tuple[int, int, str]]:
+
+    """"""
+
+    with connections.connect() as connection:
+        return [
+            (id, parent, detail)
+            for id, parent, _, detail in connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}",
+                parameters,
+            )
+        ]
+
+
+def scans(
+    plan: List[Tuple[int, int, str]],
+    expected: Tuple[str, ...] = (),
+) -> List[str]:
+
+    """"""
+
+    offending = []
+    for _, parent, detail in plan:
+        matches = _scan.match(detail)
+        if matches is None:
+            continue
+        table = _alias.sub("", matches.group(1))
+        if (table not in _large) or ((parent == 0) and (table in expected)):
+            continue
+        offending.append(detail)
+    return offending
+
+
+def audit(
+    shapes: List[Tuple[Callable, Dict[str, Any], Tuple[str, ...]]] = shapes,
+) -> List[Dict[str, Any]]:
+
+    """"""
+
+    failures = []
+    for function, kwargs, expected in shapes:
+        for i, (statement, parameters) in enumerate(capture(function, **kwargs)):
+            for detail in scans(
+                explain(statement, parameters),
+                expected=(expected if i == 0 else ()),
+            ):
+                failures.append(
+                    {
+                        "search": function.__name__,
+                        "kwargs": kwargs,
+                        "statement": _binds.sub("?, ...", " ".join(statement.split())),
+                        "detail": detail,
+                    }
+                )
+    return failures
+
+
+def main() -> None:
+
+    """"""
+
+    from rich.console import Console
+
+    console = Console()
+
+    failures = audit()
+    for failure in failures:
+        console.print(
+            f"[b red]FULL SCAN[/] {failure['detail']} in "
+            f"[b]{failure['search']}[/]({failure['kwargs']}):\n"
+            f"[dim]{failure['statement']}[/]\n"
+        )
+
+    console.print(
+        f"[b]Audited[/] {len(shapes)} query shapes: "
+        + (f"[b red]{len(failures)} full scans[/]." if failures else "[b green]OK[/].")
+    )
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
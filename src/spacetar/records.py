@@ -0,0 +1,114 @@
+import typing
+import collections
+
+import sqlalchemy as sql
+
+from sqlalchemy.sql.selectable import Select
+
+from .core import (
+    Source,
+    Molecule,
+    Telescope,
+    Wavelength,
+    assoc_mol_src,
+    assoc_mol_tel,
+    assoc_mol_wave,
+    assoc_tel_wave,
+)
+
+
+_chunk = 500
+
+
+def _record(name: str, table: sql.Table, *extras: str) -> typing.Any:
+
+    """"""
+
+    return collections.namedtuple(
+        name,
+        [_.name for _ in table.c] + list(extras),
+        module=__name__,
+    )
+
+
+MoleculeRecord = _record(
+    "MoleculeRecord",
+    Molecule.__table__,
+    "sources",
+    "telescopes",
+    "wavelengths",
+)
+
+SourceRecord = _record(
+    "SourceRecord",
+    Source.__table__,
+    "detects",
+    "molecules",
+)
+
+TelescopeRecord = _record(
+    "TelescopeRecord",
+    Telescope.__table__,
+    "detects",
+    "molecules",
+    "wavelengths",
+)
+
+
+_kinds: typing.Dict[typing.Any, typing.Tuple] = {
+    Molecule: (
+        MoleculeRecord,
+        [],
+        [
+            (assoc_mol_src, "mol_id", "src_id", Source.__table__.c.name),
+            (assoc_mol_tel, "mol_id", "tel_id", Telescope.__table__.c.name),
+            (assoc_mol_wave, "mol_id", "wave_id", Wavelength.__table__.c.name),
+        ],
+    ),
+    Source: (
+        SourceRecord,
+        [Source.detects],
+        [
+            (assoc_mol_src, "src_id", "mol_id", Molecule.__table__.c.label),
+        ],
+    ),
+    Telescope: (
+        TelescopeRecord,
+        [Telescope.detects],
+        [
+            (assoc_mol_tel, "tel_id", "mol_id", Molecule.__table__.c.label),
+            (assoc_tel_wave, "tel_id", "wave_id", Wavelength.__table__.c.name),
+        ],
+    ),
+}
+
+
+def fetch(
+    connection: sql.engine.Connection,
+    query: Select,
+    model: typing.Any,
+) -> typing.List:
+
+    """"""
+
+    record, extras, links = _kinds[model]
+
+    rows = connection.execute(
+        query.with_only_columns(*model.__table__.c, *[_.label(None) for _ in extras])
+    ).all()
+    ids = [_[0] for _ in rows]
+
+    linked: typing.List[typing.Dict[int, typing.List[str]]] = []
+    for assoc, own, other, name in links:
+        grouped: typing.Dict[int, typing.List[str]] = collections.defaultdict(list)
+        for start in range(0, len(ids), _chunk):
+            for id, value in connection.execute(
+                sql.select(assoc.c[own], name)
+                .join(name.table, name.table.c.id == assoc.c[other])
+                .where(assoc.c[own].in_(ids[start : start + _chunk]))
+                .order_by(assoc.c.id)
+            ):
+                grouped[id].append(value)
+        linked.append(grouped)
+
+    return [record(*row, *[tuple(_.get(row[0], ())) for _ in linked]) for row in rows]
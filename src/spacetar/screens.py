@@ -0,0 +1,243 @@
+import os
+import sys
+import json
+import shlex
+import shutil
+import typing
+import hashlib
+import pathlib
+import subprocess
+
+from rich.console import Console
+
+from .constants import _data, _logo, _version, _database
+
+
+console = Console()
+
+_here = pathlib.Path(__file__).parent.resolve()
+_limit = 64
+_folder = pathlib.Path(
+    os.environ.get("SPACETAR_CACHE_DIR")
+    or pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache")
+    / "spacetar"
+)
+
+
+def _stamp(path: pathlib.Path) -> typing.Optional[typing.List[int]]:
+
+    """"""
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _configured() -> pathlib.Path:
+
+    """"""
+
+    core = sys.modules.get("spacetar.core")
+    return _database if core is None else core.connections.database
+
+
+def screen_key(command: str, params: typing.Dict) -> str:
+
+    """"""
+
+    return hashlib.sha1(
+        json.dumps(
+            {
+                "command": command,
+                "params": params,
+                "width": console.width,
+                "colors": console.color_system,
+                "database": _stamp(_configured()),
+                "code": [
+                    _stamp(_here / _) for _ in ["core.py", "search.py", "display.py"]
+                ],
+            },
+            sort_keys=True,
+            default=list,
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def load_screen(key: str) -> typing.Optional[str]:
+
+    """"""
+
+    try:
+        return (_folder / f"{key}.ansi").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def read_screen(key: str, size: int = 1 << 16) -> typing.Optional[typing.Iterator[str]]:
+
+    """"""
+
+    try:
+        handle = (_folder / f"{key}.ansi").open(encoding="utf-8")
+    except OSError:
+        return None
+
+    def blocks() -> typing.Iterator[str]:
+        with handle:
+            while True:
+                block = handle.read(size)
+                if not block:
+                    break
+                yield block
+
+    return blocks()
+
+
+def _prune() -> None:
+
+    """"""
+
+    screens = sorted(_folder.glob("*.ansi"), key=lambda _: _.stat().st_mtime_ns)
+    for screen in screens[: max(len(screens) - _limit, 0)]:
+        screen.unlink(missing_ok=True)
+
+
+def store_screen(key: str, text: str) -> None:
+
+    """"""
+
+    for _ in write_screen(key, [text]):
+        pass
+
+
+def write_screen(key: str, texts: typing.Iterable[str]) -> typing.Iterator[str]:
+
+    """"""
+
+    try:
+        _folder.mkdir(parents=True, exist_ok=True)
+        temporary = _folder / f"{key}.{os.getpid()}.tmp"
+        handle = temporary.open("w", encoding="utf-8")
+    except OSError:
+        yield from texts
+        return
+
+    done = False
+    try:
+        with handle:
+            for text in texts:
+                handle.write(text)
+                yield text
+        done = True
+    finally:
+        try:
+            if done:
+                os.replace(temporary, _folder / f"{key}.ansi")
+                _prune()
+            else:
+                temporary.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def clear_screens() -> int:
+
+    """"""
+
+    screens = list(_folder.glob("*.ansi"))
+    for screen in screens:
+        screen.unlink(missing_ok=True)
+    return len(screens)
+
+
+def render(renderable: typing.Any) -> str:
+
+    """"""
+
+    with console.capture() as capture:
+        console.print(renderable)
+    return capture.get()
+
+
+def _pager() -> typing.Optional[str]:
+
+    """"""
+
+    command = os.environ.get("MANPAGER") or os.environ.get("PAGER") or "less"
+    try:
+        program = shlex.split(command)[0]
+    except (ValueError, IndexError):
+        return None
+    return command if shutil.which(program) else None
+
+
+def show(texts: typing.Iterable[str], no_pager: bool = False) -> None:
+
+    """"""
+
+    pager = None
+    command = None if no_pager or not console.file.isatty() else _pager()
+    if command is not None:
+        try:
+            pager = subprocess.Popen(
+                command,
+                shell=True,
+                stdin=subprocess.PIPE,
+                encoding="utf-8",
+            )
+        except OSError:
+            pass
+
+    if pager is None:
+        for text in texts:
+            console.file.write(text)
+            console.file.flush()
+        return
+
+    assert pager.stdin is not None
+    try:
+        for text in texts:
+            pager.stdin.write(text)
+            pager.stdin.flush()
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            pager.stdin.close()
+        except BrokenPipeError:
+            pass
+        pager.wait()
+
+
+def render_help():
+
+    """"""
+
+    console.print(_logo, style="bold", highlight=False)
+
+
+def render_usage(kind: str = "cli"):
+
+    """"""
+
+    from rich.markdown import Markdown
+
+    if kind not in ["cli", "python"]:
+        raise ValueError("There is no help for using spacetar this way. Exiting...")
+
+    with console.pager(styles=True):
+        console.print(
+            Markdown(
+                (_data / f"{kind}_usage.md").read_text(encoding="utf-8"),
+                justify="full",
+            )
+        )
+
+
+def render_version():
+
+    """"""
+
+    console.print(f"[b]Version[/]: [u]{_version()}[/]")
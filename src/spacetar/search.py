@@ -1,19 +1,42 @@
+import re
+import json
+import heapq
+import base64
+
 from math import inf
-from sqlalchemy.orm import Session
-from typing import Any, List, Optional
-from sqlalchemy import or_, and_, select
+from inspect import signature
+from sqlalchemy.orm import load_only, raiseload, selectinload
+from typing import (
+    IO,
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    NamedTuple,
+)
+from sqlalchemy import or_, and_, func, false, select, inspect, literal_column
 from sqlalchemy.sql.selectable import Select
 
+from .records import fetch
+from .export import rows, write, schema, entries, model_of
+from .cache import results as results_cache
+from .fuzzy import Match, fuzzy_index
+
 from .core import (
-    Engine,
     Source,
     Molecule,
     Telescope,
     Wavelength,
+    fulltext,
+    connections,
 )
 
 
-lk = lambda x, on: (x if not on else f"%{x}%") if x is not None else "%%"
+mt = lambda column, x, on: column.like(f"%{x}%") if on else (column == x)
 
 rn = lambda x: (
     {
@@ -25,26 +48,178 @@ rn = lambda x: (
     else [-inf, inf]
 )
 
+sr = lambda model, keys: [
+    getattr(model, column).desc() if reverse else getattr(model, column)
+    for column, reverse in keys
+]
+
+_terms = re.compile(r'[^\s"]*\w[^\s"]*')
+_models: Dict[str, Any] = {
+    "molecules": Molecule,
+    "sources": Source,
+    "telescopes": Telescope,
+}
+_keys: Dict[Any, Tuple[Tuple[str, bool], ...]] = {
+    Molecule: (("year", False), ("id", False)),
+    Source: (("detects", True), ("id", False)),
+    Telescope: (("detects", True), ("id", False)),
+}
+
+
+def _after(model: Any, keys: Tuple, values: Tuple) -> Any:
+
+    """"""
+
+    clauses = []
+    for i, ((column, reverse), value) in enumerate(zip(keys, values)):
+        attribute = getattr(model, column)
+        if value is None:
+            beyond = false() if reverse else attribute.isnot(None)
+        elif reverse:
+            beyond = or_(attribute < value, attribute.is_(None))
+        else:
+            beyond = attribute > value
+        clauses.append(
+            and_(
+                *[getattr(model, _) == __ for (_, _r), __ in zip(keys[:i], values[:i])],
+                beyond,
+            )
+        )
+    return or_(*clauses)
+
+
+class Page(NamedTuple):
+
+    """"""
+
+    results: "Results"
+    cursor: Optional[str]
+
+
+class Hit(NamedTuple):
+
+    """"""
+
+    entity: str
+    id: int
+    name: str
+    rank: float
+    alias: Optional[str]
+    category: Optional[str]
+    formula: Optional[str]
+
+    def load(self, include: Optional[List[str]] = None) -> Any:
+
+        """"""
+
+        model = _models[self.entity]
+        with connections.session() as session:
+            return session.execute(
+                select(model)
+                .where(model.id == self.id)
+                .options(*_projection(model, None, include or []))
+            ).scalar_one()
+
 
 class Results(list):
 
     """"""
 
+    _columns: Dict[str, List]
+    _model: Optional[type]
+
     def __str__(self) -> str:
         return f"<Results | Number of results: {self.count})>"
 
     def __repr__(self) -> str:
         return str(self)
 
+    def __getitem__(self, index: Any):
+        if isinstance(index, slice):
+            return self.subset(range(len(self))[index])
+        return super().__getitem__(index)
+
     @classmethod
     def from_query(cls, query: Select):
-        with Session(Engine) as session:
+        with connections.session() as session:
             return cls([_[0] for _ in session.execute(query).all()])
 
+    @classmethod
+    def from_records(cls, query: Select, model: Any):
+        with connections.connect() as connection:
+            return cls(fetch(connection, query, model))
+
     @property
     def count(self):
         return len(self)
 
+    def export(
+        self,
+        file: IO,
+        format: str = "jsonl",
+        fields: Optional[List[str]] = None,
+    ) -> int:
+
+        """"""
+
+        model = self.__dict__.get("_model") or (model_of(self[0]) if self else None)
+        if model is None:
+            raise ValueError("Cannot export an empty result without knowing its kind.")
+        return write(entries(self, model, fields), file, format, schema(model, fields))
+
+    def to_jsonl(self, file: IO, fields: Optional[List[str]] = None) -> int:
+
+        """"""
+
+        return self.export(file, "jsonl", fields)
+
+    def to_csv(self, file: IO, fields: Optional[List[str]] = None) -> int:
+
+        """"""
+
+        return self.export(file, "csv", fields)
+
+    def to_parquet(self, file: Any, fields: Optional[List[str]] = None) -> int:
+
+        """"""
+
+        return self.export(file, "parquet", fields)
+
+    def column(self, column: str) -> List:
+
+        """"""
+
+        columns = self.__dict__.setdefault("_columns", {})
+        if column not in columns:
+            columns[column] = [getattr(_, column) for _ in self]
+        return columns[column]
+
+    def array(self, column: str) -> Any:
+
+        """"""
+
+        try:
+            import numpy as np  # type: ignore
+        except ImportError:
+            raise ImportError(
+                "Column arrays need NumPy. Install it with `pip install spacetar[fast]`."
+            )
+        return np.asarray(self.column(column))
+
+    def subset(self, indices: Iterable[int]):
+
+        """"""
+
+        indices = list(indices)
+        subset = Results([self[_] for _ in indices])
+        subset._columns = {
+            column: [values[_] for _ in indices]
+            for column, values in self.__dict__.get("_columns", {}).items()
+        }
+        if "_model" in self.__dict__:
+            subset._model = self._model
+        return subset
+
     def search(
         self,
         column: str,
@@ -53,43 +228,36 @@ class Results(list):
 
         """"""
 
-        return Results(filter(lambda _: getattr(_, column) == term, self))
+        values = self.column(column)
+        return self.subset([_ for _, value in enumerate(values) if value == term])
+
+    def filter(self, predicate: Callable[[Any], bool]):
+
+        """"""
+
+        return self.subset([_ for _, entry in enumerate(self) if predicate(entry)])
 
     def most(self, column: str):
 
         """"""
 
-        return Results(
-            filter(
-                lambda _: getattr(_, column)
-                == getattr(
-                    max(
-                        self,
-                        key=lambda _: getattr(_, column),
-                    ),
-                    column,
-                ),
-                self,
-            )
-        )
+        values = self.column(column)
+        present = [_ for _ in values if _ is not None]
+        if not present:
+            return self.subset([])
+        best = max(present)
+        return self.subset([_ for _, value in enumerate(values) if value == best])
 
     def least(self, column: str):
 
         """"""
 
-        return Results(
-            filter(
-                lambda _: getattr(_, column)
-                == getattr(
-                    min(
-                        self,
-                        key=lambda _: getattr(_, column),
-                    ),
-                    column,
-                ),
-                self,
-            )
-        )
+        values = self.column(column)
+        present = [_ for _ in values if _ is not None]
+        if not present:
+            return self.subset([])
+        best = min(present)
+        return self.subset([_ for _, value in enumerate(values) if value == best])
 
     def between(
         self,
@@ -99,12 +267,13 @@ class Results(list):
 
         """"""
 
-        return Results(
+        low, high = between
+        values = self.column(column)
+        return self.subset(
             [
-                result
-                for result in self
-                if (getattr(result, column) >= between[0])
-                and (getattr(result, column) <= between[1])
+                _
+                for _, value in enumerate(values)
+                if (value is not None) and (low <= value <= high)
             ]
         )
 
@@ -116,16 +285,393 @@ class Results(list):
 
         """"""
 
-        return Results(
+        values = self.column(column)
+        return self.subset(
             sorted(
-                self,
-                key=lambda _: getattr(_, column),
+                range(len(values)),
+                key=lambda _: (values[_] is not None, values[_]),
                 reverse=reverse,
             )
         )
 
+    def top_k(
+        self,
+        column: str,
+        k: int = 5,
+        largest: bool = True,
+    ):
 
-def search_molecule(
+        """"""
+
+        values = self.column(column)
+        indices = [_ for _, value in enumerate(values) if value is not None]
+        pick = heapq.nlargest if largest else heapq.nsmallest
+        return self.subset(pick(k, indices, key=values.__getitem__))
+
+    def group_by(self, column: str) -> Dict[Any, "Results"]:
+
+        """"""
+
+        groups: Dict[Any, List[int]] = {}
+        for _, value in enumerate(self.column(column)):
+            groups.setdefault(value, []).append(_)
+        return {value: self.subset(indices) for value, indices in groups.items()}
+
+
+def _invalidating(name: str) -> Callable:
+
+    """"""
+
+    method = getattr(list, name)
+
+    def invalidate(self, *args, **kwargs):
+        self.__dict__.pop("_columns", None)
+        return method(self, *args, **kwargs)
+
+    invalidate.__name__ = name
+    return invalidate
+
+
+for _ in [
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+]:
+    setattr(Results, _, _invalidating(_))
+
+
+class Query:
+
+    """"""
+
+    def __init__(
+        self,
+        builder: Callable,
+        model: Any,
+        args: Tuple = (),
+        kwargs: Optional[Dict] = None,
+        records: bool = False,
+        cached: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
+    ):
+        self.model = model
+        self.builder = builder
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.records = records
+        self.cached = records if cached is None else cached
+        self.fields = fields
+        self.include = include
+        self._wheres: Tuple = ()
+        self._orders: Tuple = ()
+        self._offset = 0
+        self._limit: Optional[int] = None
+        self._after: Optional[Tuple] = None
+        self._steps: Tuple = ()
+        self._results: Optional[Results] = None
+
+    def __str__(self) -> str:
+        if self._results is None:
+            return f"<Query | {self.model.__tablename__}, not yet run>"
+        return f"<Query | Number of results: {len(self._results)}>"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def __len__(self) -> int:
+        return len(self.all())
+
+    def __bool__(self) -> bool:
+        return len(self) != 0
+
+    def __contains__(self, entry: Any) -> bool:
+        return entry in self.all()
+
+    def __eq__(self, other: Any) -> bool:
+        return self.all() == (other.all() if isinstance(other, Query) else other)
+
+    def __getitem__(self, index: Any):
+        if isinstance(index, slice) and self._sliceable(index):
+            start = index.start or 0
+            stops = [_ for _ in [self._limit, index.stop] if _ is not None]
+            return self._with(
+                _offset=self._offset + start,
+                _limit=max(min(stops) - start, 0) if stops else None,
+            )
+        return self.all()[index]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.all(), name)
+
+    @property
+    def count(self) -> int:
+        if (self._results is not None) or self._steps:
+            return len(self.all())
+        with connections.connect() as connection:
+            return connection.execute(
+                select(func.count()).select_from(
+                    self.statement.order_by(None).subquery()
+                )
+            ).scalar_one()
+
+    def _with(self, **changes: Any) -> "Query":
+
+        """"""
+
+        query = object.__new__(Query)
+        query.__dict__.update({**self.__dict__, "_results": None, **changes})
+        return query
+
+    def _sliceable(self, index: slice) -> bool:
+
+        """"""
+
+        return (
+            (not self._steps)
+            and (index.step in [None, 1])
+            and ((index.start or 0) >= 0)
+            and ((index.stop is None) or (index.stop >= 0))
+        )
+
+    def _sql(self, column: str) -> bool:
+
+        """"""
+
+        return (
+            (not self._steps)
+            and (self._limit is None)
+            and (self._offset == 0)
+            and (column in inspect(self.model).column_attrs.keys())
+        )
+
+    def _where(self, name: str, column: str, *args: Any) -> "Query":
+
+        """"""
+
+        if self._sql(column):
+            return self._with(_wheres=self._wheres + ((name, column, args),))
+        return self._with(_steps=self._steps + ((name, (column, *args)),))
+
+    @property
+    def keys(self) -> Tuple[Tuple[str, bool], ...]:
+
+        """"""
+
+        keys: Dict[str, bool] = {}
+        for column, reverse in self._orders + _keys[self.model]:
+            keys.setdefault(column, reverse)
+        return tuple(keys.items())
+
+    @property
+    def statement(self) -> Select:
+
+        """"""
+
+        statement = self.builder(*self.args, **self.kwargs)
+        for name, column, args in self._wheres:
+            attribute = getattr(self.model, column)
+            if name == "search":
+                statement = statement.where(attribute == args[0])
+            elif name == "between":
+                statement = statement.where(attribute.between(*args[0]))
+            elif name == "present":
+                statement = statement.where(attribute.isnot(None))
+            else:
+                ids = statement.with_only_columns(self.model.id).order_by(None)
+                statement = statement.where(
+                    attribute
+                    == select({"most": func.max, "least": func.min}[name](attribute))
+                    .select_from(self.model)
+                    .where(self.model.id.in_(ids))
+                    .scalar_subquery()
+                )
+        if self._after is not None:
+            statement = statement.where(_after(self.model, self.keys, self._after))
+        if self._orders:
+            statement = statement.order_by(None).order_by(*sr(self.model, self.keys))
+        if self._offset:
+            statement = statement.offset(self._offset)
+        if self._limit is not None:
+            statement = statement.limit(self._limit)
+        return statement
+
+    def all(self) -> Results:
+
+        """"""
+
+        if self._results is None:
+
+            def load() -> Results:
+                if self.records:
+                    return Results.from_records(self.statement, self.model)
+                return Results.from_query(
+                    self.statement.options(
+                        *_projection(self.model, self.fields, self.include)
+                    )
+                )
+
+            if self.cached:
+                results = Results(
+                    results_cache.get(
+                        (
+                            self.records,
+                            None if self.fields is None else tuple(self.fields),
+                            None if self.include is None else tuple(self.include),
+                            results_cache.key(self.builder, *self.args, **self.kwargs),
+                            (
+                                self._wheres,
+                                self._orders,
+                                self._after,
+                                self._offset,
+                                self._limit,
+                            ),
+                        ),
+                        load,
+                    )
+                )
+            else:
+                results = load()
+            results._model = self.model
+            for name, args in self._steps:
+                results = getattr(results, name)(*args)
+            self._results = results
+        return self._results
+
+    def search(self, column: str, term: Any) -> "Query":
+
+        """"""
+
+        return self._where("search", column, term)
+
+    def between(self, column: str, between: List) -> "Query":
+
+        """"""
+
+        return self._where("between", column, tuple(between))
+
+    def most(self, column: str) -> "Query":
+
+        """"""
+
+        return self._where("most", column)
+
+    def least(self, column: str) -> "Query":
+
+        """"""
+
+        return self._where("least", column)
+
+    def filter(self, predicate: Callable[[Any], bool]) -> "Query":
+
+        """"""
+
+        return self._with(_steps=self._steps + (("filter", (predicate,)),))
+
+    def orderby(self, column: str, reverse: bool = False) -> "Query":
+
+        """"""
+
+        if self._sql(column):
+            return self._with(_orders=((column, reverse),) + self._orders)
+        return self._with(_steps=self._steps + (("orderby", (column, reverse)),))
+
+    def top_k(self, column: str, k: int = 5, largest: bool = True) -> "Query":
+
+        """"""
+
+        if self._sql(column):
+            return self._where("present", column).orderby(column, reverse=largest)[:k]
+        return self._with(_steps=self._steps + (("top_k", (column, k, largest)),))
+
+    def limit(self, limit: int) -> "Query":
+
+        """"""
+
+        return self[:limit]
+
+    def offset(self, offset: int) -> "Query":
+
+        """"""
+
+        return self[offset:]
+
+    def page(self, size: int = 50, cursor: Optional[str] = None) -> Page:
+
+        """"""
+
+        if self._steps or self._offset or (self._limit is not None):
+            raise ValueError(
+                "Cursors only work on queries that are filtered and ordered in SQL."
+            )
+
+        keys = self.keys
+        query = self
+        if cursor is not None:
+            state = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            if [tuple(_) for _ in state["keys"]] != list(keys):
+                raise ValueError("This cursor belongs to a differently ordered query.")
+            query = self._with(_after=tuple(state["values"]))
+        if self.fields is not None:
+            query = query._with(
+                fields=list(self.fields) + [_ for _, __ in keys if _ not in self.fields]
+            )
+
+        results = query[: size + 1].all()
+        if len(results) <= size:
+            return Page(results, None)
+        last = results[size - 1]
+        return Page(
+            results[:size],
+            base64.urlsafe_b64encode(
+                json.dumps(
+                    {
+                        "keys": keys,
+                        "values": [getattr(last, _) for _, __ in keys],
+                    }
+                ).encode("utf-8")
+            ).decode("ascii"),
+        )
+
+    def stream(self, size: int = 64) -> Iterator:
+
+        """"""
+
+        if (self._results is not None) or self._steps:
+            yield from self.all()
+        elif self._offset or (self._limit is not None):
+            start = 0
+            while True:
+                chunk = self[start : start + size].all()
+                yield from chunk
+                if len(chunk) < size:
+                    return
+                start += size
+        else:
+            cursor = None
+            while True:
+                page = self.page(size, cursor)
+                yield from page.results
+                if page.cursor is None:
+                    return
+                cursor = page.cursor
+
+
+def molecule_query(
     like: bool = False,
     name: Optional[str] = None,
     formula: Optional[str] = None,
@@ -144,88 +690,75 @@ def search_molecule(
     ppd: Optional[bool] = None,
     exgal: Optional[bool] = None,
     exo: Optional[bool] = None,
-) -> List:
+) -> Select:
 
     """"""
 
-    results = Results.from_query(
-        (
-            (
-                select(Molecule)
-                .where(Molecule.name.like(lk(name, like)))
-                .where(Molecule.formula.like(lk(formula, like)))
-                .where(
-                    and_(
-                        Molecule.year >= rn(year)[0],
-                        Molecule.year <= rn(year)[1],
-                    )
-                )
-                .where(Molecule.sources.any(Source.name.like(lk(source, like))))
-                .where(
-                    Molecule.telescopes.any(
-                        or_(
-                            Telescope.name.like(lk(telescope, like)),
-                            Telescope.nick.like(lk(telescope, like)),
-                        )
-                    )
-                )
-                .where(
-                    Molecule.wavelengths.any(Wavelength.name.like(lk(wavelength, like)))
-                )
-                .where(
-                    and_(
-                        *[
-                            getattr(Molecule, _) == __
-                            for _, __ in [
-                                ("cyclic", cyclic),
-                                ("fullerene", fullerene),
-                                ("pah", pah),
-                                ("ice", ice),
-                                ("ppd", ppd),
-                                ("exgal", exgal),
-                                ("exo", exo),
-                            ]
-                            if __ is not None
-                        ]
-                    )
+    query = select(Molecule)
+
+    if name is not None:
+        query = query.where(mt(Molecule.name, name, like))
+    if formula is not None:
+        query = query.where(mt(Molecule.formula, formula, like))
+    if (year is not None) and (len(year) != 0):
+        query = query.where(Molecule.year.between(*rn(year)))
+    if source is not None:
+        query = query.where(Molecule.sources.any(mt(Source.name, source, like)))
+    if telescope is not None:
+        query = query.where(
+            Molecule.telescopes.any(
+                or_(
+                    mt(Telescope.name, telescope, like),
+                    mt(Telescope.nick, telescope, like),
                 )
             )
         )
-    )
+    if wavelength is not None:
+        query = query.where(
+            Molecule.wavelengths.any(mt(Wavelength.name, wavelength, like))
+        )
 
-    for _, __ in [
+    for name, flag in [
         ("neutral", neutral),
         ("cation", cation),
         ("anion", anion),
         ("radical", radical),
+        ("cyclic", cyclic),
+        ("fullerene", fullerene),
+        ("pah", pah),
+        ("ice", ice),
+        ("ppd", ppd),
+        ("exgal", exgal),
+        ("exo", exo),
     ]:
-        if __ is not None:
-            results = results.search(column=_, term=__)
+        if flag is not None:
+            query = query.where(getattr(Molecule, name) == flag)
 
-    return results.orderby("year")
+    return query.order_by(*sr(Molecule, _keys[Molecule]))
 
 
-def search_source(
+def source_query(
     like: bool = False,
     name: Optional[str] = None,
     kind: Optional[str] = None,
     detects: Optional[List[int]] = None,
-) -> List:
+) -> Select:
 
     """"""
 
-    return (
-        Results.from_query(
-            select(Source)
-            .where(Source.name.like(lk(name, like)))
-            .where(Source.kind.like(lk(kind, like)))
-        )
-        .between("detects", between=rn(detects))
-        .orderby("detects", reverse=True)
-    )
+    query = select(Source)
 
+    if name is not None:
+        query = query.where(mt(Source.name, name, like))
+    if kind is not None:
+        query = query.where(mt(Source.kind, kind, like))
+    if (detects is not None) and (len(detects) != 0):
+        query = query.where(Source.detects.between(*rn(detects)))
 
-def search_telescope(
+    return query.order_by(*sr(Source, _keys[Source]))
+
+
+def telescope_query(
     like: bool = False,
     name: Optional[str] = None,
     kind: Optional[str] = None,
@@ -234,21 +767,25 @@ def search_telescope(
     built: Optional[List[int]] = None,
     decommissioned: Optional[List[int]] = None,
     detects: Optional[List[int]] = None,
-) -> List:
+) -> Select:
 
     """"""
 
-    query = (
-        select(Telescope)
-        .where(
+    query = select(Telescope)
+
+    if name is not None:
+        query = query.where(
             or_(
-                Telescope.name.like(lk(name, like)),
-                Telescope.nick.like(lk(name, like)),
+                mt(Telescope.name, name, like),
+                mt(Telescope.nick, name, like),
             )
         )
-        .where(Telescope.kind.like(lk(kind, like)))
-        .where(Telescope.wavelengths.any(Wavelength.name.like(lk(wavelength, like))))
-    )
+    if kind is not None:
+        query = query.where(mt(Telescope.kind, kind, like))
+    if wavelength is not None:
+        query = query.where(
+            Telescope.wavelengths.any(mt(Wavelength.name, wavelength, like))
+        )
 
     for name, term in [
         ("diameter", diameter),
@@ -256,16 +793,290 @@ def search_telescope(
         ("decommissioned", decommissioned),
     ]:
         if (term is not None) and (len(term) != 0):
-            query = query.where(
-                and_(
-                    getattr(Telescope, name) >= rn(term)[0],
-                    getattr(Telescope, name) <= rn(term)[1],
-                    getattr(Telescope, name).is_not(None),
-                )
-            )
+            query = query.where(getattr(Telescope, name).between(*rn(term)))
+
+    if (detects is not None) and (len(detects) != 0):
+        query = query.where(Telescope.detects.between(*rn(detects)))
+
+    return query.order_by(*sr(Telescope, _keys[Telescope]))
+
+
+def _projection(
+    model: Any,
+    fields: Optional[List[str]],
+    include: Optional[List[str]],
+) -> List:
 
-    return (
-        Results.from_query(query)
-        .between("detects", between=rn(detects))
-        .orderby("detects", reverse=True)
+    """"""
+
+    if (fields is None) and (include is None):
+        return []
+
+    mapper = inspect(model)
+    relations = list(mapper.relationships.keys())
+    columns = list(mapper.column_attrs.keys())
+    unknown = [_ for _ in (fields or []) if _ not in columns] + [
+        _ for _ in (include or []) if _ not in relations
+    ]
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s) for {model.__tablename__}: {', '.join(unknown)}. "
+            f"Choose columns from: {', '.join(columns)}; "
+            f"and relationships from: {', '.join(relations)}."
+        )
+
+    options: List = []
+    if fields is not None:
+        options.append(load_only(*[getattr(model, _) for _ in fields]))
+    for relation in relations:
+        if relation in (include or []):
+            options.append(selectinload(getattr(model, relation)).raiseload("*"))
+        else:
+            options.append(raiseload(getattr(model, relation)))
+    return options
+
+
+def _search(
+    builder: Callable,
+    model: Any,
+    args: Tuple,
+    kwargs: Dict,
+    records: bool,
+    cached: Optional[bool],
+    fields: Optional[List[str]] = None,
+    include: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> Query:
+
+    """"""
+
+    if records and ((fields is not None) or (include is not None)):
+        raise ValueError("`fields` and `include` only apply to ORM results.")
+    _projection(model, fields, include)
+    signature(builder).bind(*args, **kwargs)
+    query = Query(builder, model, args, kwargs, records, cached, fields, include)
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def search_molecule(
+    *args,
+    records: bool = False,
+    cached: Optional[bool] = None,
+    fields: Optional[List[str]] = None,
+    include: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    **kwargs,
+) -> Query:
+
+    """"""
+
+    return _search(
+        molecule_query,
+        Molecule,
+        args,
+        kwargs,
+        records,
+        cached,
+        fields,
+        include,
+        limit,
+        offset,
+    )
+
+
+def search_source(
+    *args,
+    records: bool = False,
+    cached: Optional[bool] = None,
+    fields: Optional[List[str]] = None,
+    include: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    **kwargs,
+) -> Query:
+
+    """"""
+
+    return _search(
+        source_query,
+        Source,
+        args,
+        kwargs,
+        records,
+        cached,
+        fields,
+        include,
+        limit,
+        offset,
+    )
+
+
+def search_telescope(
+    *args,
+    records: bool = False,
+    cached: Optional[bool] = None,
+    fields: Optional[List[str]] = None,
+    include: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    **kwargs,
+) -> Query:
+
+    """"""
+
+    return _search(
+        telescope_query,
+        Telescope,
+        args,
+        kwargs,
+        records,
+        cached,
+        fields,
+        include,
+        limit,
+        offset,
+    )
+
+
+def _export(
+    builder: Callable,
+    model: Any,
+    file: Any,
+    format: str,
+    fields: Optional[List[str]],
+    args: Tuple,
+    kwargs: Dict,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> int:
+
+    """"""
+
+    query = builder(*args, **kwargs)
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return write(rows(query, model, fields), file, format, schema(model, fields))
+
+
+def export_molecule(
+    file: Any,
+    *args,
+    format: str = "jsonl",
+    fields: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    **kwargs,
+) -> int:
+
+    """"""
+
+    return _export(
+        molecule_query, Molecule, file, format, fields, args, kwargs, limit, offset
+    )
+
+
+def export_source(
+    file: Any,
+    *args,
+    format: str = "jsonl",
+    fields: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    **kwargs,
+) -> int:
+
+    """"""
+
+    return _export(
+        source_query, Source, file, format, fields, args, kwargs, limit, offset
+    )
+
+
+def export_telescope(
+    file: Any,
+    *args,
+    format: str = "jsonl",
+    fields: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    **kwargs,
+) -> int:
+
+    """"""
+
+    return _export(
+        telescope_query, Telescope, file, format, fields, args, kwargs, limit, offset
+    )
+
+
+def text_query(
+    query: str,
+    kind: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Optional[Select]:
+
+    """"""
+
+    terms = " ".join([f'"{_}"*' for _ in _terms.findall(query)])
+    if not terms:
+        return None
+
+    rank = func.bm25(
+        literal_column("fulltext"),
+        *[0.0, 0.0, 10.0, 5.0, 2.0, 10.0, 1.0, 1.0],
+    ).label("rank")
+
+    statement = (
+        select(
+            fulltext.c.entity,
+            fulltext.c.ref,
+            fulltext.c.name,
+            rank,
+            fulltext.c.alias,
+            fulltext.c.category,
+            fulltext.c.formula,
+        )
+        .where(literal_column("fulltext").op("MATCH")(terms))
+        .order_by(rank)
     )
+    if kind is not None:
+        statement = statement.where(fulltext.c.entity == kind)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def search_text(
+    query: str,
+    kind: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Results:
+
+    """"""
+
+    statement = text_query(query, kind=kind, limit=limit)
+    if statement is None:
+        return Results()
+
+    with connections.connect() as connection:
+        return Results([Hit(*_) for _ in connection.execute(statement)])
+
+
+def search_fuzzy(
+    name: str,
+    kind: Optional[str] = None,
+    k: int = 5,
+    cutoff: float = 0.3,
+) -> List[Match]:
+
+    """"""
+
+    return fuzzy_index().top(name, k=k, kind=kind, cutoff=cutoff)
@@ -0,0 +1,392 @@
+import re
+import typing
+import sqlite3
+import pathlib
+import threading
+
+from . import core
+from .search import Results, rn, _keys, _models
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+else:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+
+_links = {
+    "assoc_mol_src": ("mol_id", "molecules", "src_id", "sources"),
+    "assoc_mol_tel": ("mol_id", "molecules", "tel_id", "telescopes"),
+    "assoc_mol_wave": ("mol_id", "molecules", "wave_id", "wavelengths"),
+    "assoc_tel_wave": ("tel_id", "telescopes", "wave_id", "wavelengths"),
+}
+
+_relations = {
+    ("molecules", "sources"): ("assoc_mol_src", 0),
+    ("molecules", "telescopes"): ("assoc_mol_tel", 0),
+    ("molecules", "wavelengths"): ("assoc_mol_wave", 0),
+    ("sources", "molecules"): ("assoc_mol_src", 1),
+    ("telescopes", "molecules"): ("assoc_mol_tel", 1),
+    ("telescopes", "wavelengths"): ("assoc_tel_wave", 0),
+    ("wavelengths", "molecules"): ("assoc_mol_wave", 1),
+    ("wavelengths", "telescopes"): ("assoc_tel_wave", 1),
+}
+
+
+class Entry:
+
+    """"""
+
+    __slots__ = ("_snapshot", "_table", "_index")
+
+    def __init__(self, snapshot: "Snapshot", table: str, index: int):
+        self._table = table
+        self._index = index
+        self._snapshot = snapshot
+
+    def __getattr__(self, name: str) -> typing.Any:
+        snapshot = self._snapshot
+        if name in snapshot.values[self._table]:
+            return snapshot.values[self._table][name][self._index]
+        if (self._table, name) in _relations:
+            return snapshot.related(self._table, name, self._index)
+        if (self._table, name) == ("molecules", "composition"):
+            return core._elements(self.formula)
+        raise AttributeError(name)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return (
+            isinstance(other, Entry)
+            and (self._table == other._table)
+            and (self.id == other.id)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._table, self.id))
+
+    def __str__(self) -> str:
+        return f"<{self._table[:-1].capitalize()}: {self.name}>"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Snapshot:
+
+    """"""
+
+    def __init__(self, database: typing.Optional[pathlib.Path] = None):
+        if np is None:
+            raise ImportError(
+                "The in-memory snapshot engine needs NumPy. "
+                "Install it with `pip install spacetar[fast]`."
+            )
+
+        self.database = database or core.connections.database
+        self.values: typing.Dict[str, typing.Dict[str, typing.List]] = {}
+        self.columns: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        self.lowered: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        self.edges: typing.Dict[str, typing.Tuple[typing.Any, typing.Any]] = {}
+        self.adjacency: typing.Dict[typing.Tuple[str, int], typing.Tuple] = {}
+
+        connection = sqlite3.connect(
+            f"{pathlib.Path(self.database).resolve().as_uri()}?mode=ro", uri=True
+        )
+        try:
+            for table in ["molecules", "sources", "telescopes", "wavelengths"]:
+                types = {
+                    _[1]: _[2].upper()
+                    for _ in connection.execute(f"PRAGMA table_info({table})")
+                }
+                cursor = connection.execute(f"SELECT * FROM {table} ORDER BY id")
+                rows = cursor.fetchall()
+                self.values[table] = {}
+                self.columns[table] = {}
+                self.lowered[table] = {}
+                for _, (name, kind) in enumerate(types.items()):
+                    values = [row[_] for row in rows]
+                    if kind == "BOOLEAN":
+                        values = [bool(__) if __ is not None else None for __ in values]
+                    self.values[table][name] = values
+                    if kind.startswith("VARCHAR") or (kind == "TEXT"):
+                        self.columns[table][name] = np.array(
+                            [__ if __ is not None else "" for __ in values], dtype=str
+                        )
+                        self.lowered[table][name] = np.char.lower(
+                            self.columns[table][name]
+                        )
+                        self.columns[table][f"{name}?"] = np.array(
+                            [__ is not None for __ in values], dtype=bool
+                        )
+                    else:
+                        self.columns[table][name] = np.array(
+                            [__ if __ is not None else np.nan for __ in values],
+                            dtype=float,
+                        )
+
+            positions = {
+                table: {id: _ for _, id in enumerate(self.values[table]["id"])}
+                for table in self.values
+            }
+
+            for assoc, (left, owner, right, other) in _links.items():
+                pairs = connection.execute(
+                    f"SELECT {left}, {right} FROM {assoc} ORDER BY id"
+                ).fetchall()
+                self.edges[assoc] = (
+                    np.array([positions[owner][_[0]] for _ in pairs], dtype=np.intp),
+                    np.array([positions[other][_[1]] for _ in pairs], dtype=np.intp),
+                )
+        finally:
+            connection.close()
+
+        for table, assoc in [
+            ("sources", "assoc_mol_src"),
+            ("telescopes", "assoc_mol_tel"),
+        ]:
+            detects = np.bincount(
+                self.edges[assoc][1],
+                minlength=len(self.values[table]["id"]),
+            )
+            self.columns[table]["detects"] = detects.astype(float)
+            self.values[table]["detects"] = detects.tolist()
+
+    def __str__(self) -> str:
+        return (
+            "<Snapshot | "
+            + ", ".join(
+                [
+                    f"{table}: {len(values['id'])}"
+                    for table, values in self.values.items()
+                ]
+            )
+            + ">"
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def related(self, table: str, name: str, index: int) -> typing.List[Entry]:
+
+        """"""
+
+        assoc, side = _relations[table, name]
+        if (assoc, side) not in self.adjacency:
+            owners, others = self.edges[assoc][side], self.edges[assoc][1 - side]
+            order = np.argsort(owners, kind="stable")
+            counts = np.bincount(owners, minlength=len(self.values[table]["id"]))
+            self.adjacency[assoc, side] = (
+                np.concatenate([[0], np.cumsum(counts)]).tolist(),
+                others[order].tolist(),
+            )
+        bounds, neighbours = self.adjacency[assoc, side]
+        return [
+            Entry(self, name, _) for _ in neighbours[bounds[index] : bounds[index + 1]]
+        ]
+
+    def match(self, table: str, column: str, term: str, like: bool):
+
+        """"""
+
+        present = self.columns[table][f"{column}?"]
+        if like and (("%" in term) or ("_" in term)):
+            pattern = re.compile(
+                "".join(
+                    {"%": ".*", "_": "."}.get(_, re.escape(_)) for _ in term.lower()
+                ),
+                re.DOTALL,
+            )
+            found = np.array(
+                [bool(pattern.search(_)) for _ in self.lowered[table][column]],
+                dtype=bool,
+            )
+        elif like:
+            found = np.char.find(self.lowered[table][column], term.lower()) >= 0
+        else:
+            found = self.columns[table][column] == term
+        return found & present
+
+    def between(self, table: str, column: str, term: typing.List):
+
+        """"""
+
+        low, high = rn(term)
+        values = self.columns[table][column]
+        return (values >= low) & (values <= high)
+
+    def linked(self, assoc: str, side: int, mask, size: int):
+
+        """"""
+
+        owners, others = self.edges[assoc][side], self.edges[assoc][1 - side]
+        found = np.zeros(size, dtype=bool)
+        found[owners[mask[others]]] = True
+        return found
+
+    def results(self, table: str, mask) -> Results:
+
+        """"""
+
+        keys = []
+        for column, reverse in _keys[_models[table]]:
+            values = self.columns[table][column]
+            missing = np.isnan(values)
+            keys.append(missing if reverse else ~missing)
+            keys.append(np.where(missing, 0.0, -values if reverse else values))
+        order = np.lexsort(keys[::-1])
+        return Results([Entry(self, table, _) for _ in order[mask[order]].tolist()])
+
+    def search_molecule(
+        self,
+        like: bool = False,
+        name: typing.Optional[str] = None,
+        formula: typing.Optional[str] = None,
+        year: typing.Optional[typing.List[int]] = None,
+        source: typing.Optional[str] = None,
+        telescope: typing.Optional[str] = None,
+        wavelength: typing.Optional[str] = None,
+        neutral: typing.Optional[bool] = None,
+        cation: typing.Optional[bool] = None,
+        anion: typing.Optional[bool] = None,
+        radical: typing.Optional[bool] = None,
+        cyclic: typing.Optional[bool] = None,
+        fullerene: typing.Optional[bool] = None,
+        pah: typing.Optional[bool] = None,
+        ice: typing.Optional[bool] = None,
+        ppd: typing.Optional[bool] = None,
+        exgal: typing.Optional[bool] = None,
+        exo: typing.Optional[bool] = None,
+    ) -> Results:
+
+        """"""
+
+        columns = self.columns["molecules"]
+        mask = np.ones(len(columns["id"]), dtype=bool)
+
+        if name is not None:
+            mask &= self.match("molecules", "name", name, like)
+        if formula is not None:
+            mask &= self.match("molecules", "formula", formula, like)
+        if (year is not None) and (len(year) != 0):
+            mask &= self.between("molecules", "year", year)
+        if source is not None:
+            mask &= self.linked(
+                "assoc_mol_src",
+                0,
+                self.match("sources", "name", source, like),
+                len(mask),
+            )
+        if telescope is not None:
+            mask &= self.linked(
+                "assoc_mol_tel",
+                0,
+                self.match("telescopes", "name", telescope, like)
+                | self.match("telescopes", "nick", telescope, like),
+                len(mask),
+            )
+        if wavelength is not None:
+            mask &= self.linked(
+                "assoc_mol_wave",
+                0,
+                self.match("wavelengths", "name", wavelength, like),
+                len(mask),
+            )
+
+        for column, flag in [
+            ("neutral", neutral),
+            ("cation", cation),
+            ("anion", anion),
+            ("radical", radical),
+            ("cyclic", cyclic),
+            ("fullerene", fullerene),
+            ("pah", pah),
+            ("ice", ice),
+            ("ppd", ppd),
+            ("exgal", exgal),
+            ("exo", exo),
+        ]:
+            if flag is not None:
+                mask &= columns[column] == float(flag)
+
+        return self.results("molecules", mask)
+
+    def search_source(
+        self,
+        like: bool = False,
+        name: typing.Optional[str] = None,
+        kind: typing.Optional[str] = None,
+        detects: typing.Optional[typing.List[int]] = None,
+    ) -> Results:
+
+        """"""
+
+        columns = self.columns["sources"]
+        mask = np.ones(len(columns["id"]), dtype=bool)
+
+        if name is not None:
+            mask &= self.match("sources", "name", name, like)
+        if kind is not None:
+            mask &= self.match("sources", "kind", kind, like)
+        if (detects is not None) and (len(detects) != 0):
+            mask &= self.between("sources", "detects", detects)
+
+        return self.results("sources", mask)
+
+    def search_telescope(
+        self,
+        like: bool = False,
+        name: typing.Optional[str] = None,
+        kind: typing.Optional[str] = None,
+        wavelength: typing.Optional[str] = None,
+        diameter: typing.Optional[typing.List[int]] = None,
+        built: typing.Optional[typing.List[int]] = None,
+        decommissioned: typing.Optional[typing.List[int]] = None,
+        detects: typing.Optional[typing.List[int]] = None,
+    ) -> Results:
+
+        """"""
+
+        columns = self.columns["telescopes"]
+        mask = np.ones(len(columns["id"]), dtype=bool)
+
+        if name is not None:
+            mask &= self.match("telescopes", "name", name, like) | self.match(
+                "telescopes", "nick", name, like
+            )
+        if kind is not None:
+            mask &= self.match("telescopes", "kind", kind, like)
+        if wavelength is not None:
+            mask &= self.linked(
+                "assoc_tel_wave",
+                0,
+                self.match("wavelengths", "name", wavelength, like),
+                len(mask),
+            )
+        for column, term in [
+            ("diameter", diameter),
+            ("built", built),
+            ("decommissioned", decommissioned),
+            ("detects", detects),
+        ]:
+            if (term is not None) and (len(term) != 0):
+                mask &= self.between("telescopes", column, term)
+
+        return self.results("telescopes", mask)
+
+
+_cache: typing.Dict[str, typing.Any] = {"stamp": None, "snapshot": None}
+_lock = threading.Lock()
+
+
+def snapshot() -> Snapshot:
+
+    """"""
+
+    stamp = core._stamp()
+    with _lock:
+        if _cache["stamp"] != stamp:
+            _cache["snapshot"] = Snapshot()
+            _cache["stamp"] = stamp
+        return _cache["snapshot"]
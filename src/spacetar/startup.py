@@ -0,0 +1,148 @@
+import os
+import re
+import sys
+import time
+import tempfile
+import subprocess
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+_line = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+_heavy = [
+    "sqlalchemy",
+    "pyparsing",
+    "rich.console",
+    "rich.markdown",
+    "importlib_metadata",
+]
+
+commands: List[Tuple[str, List[str], Dict[str, str], List[str]]] = [
+    (
+        "complete",
+        [],
+        {
+            "_SPACETAR_COMPLETE": "bash_complete",
+            "COMP_WORDS": "spacetar m",
+            "COMP_CWORD": "1",
+        },
+        ["sqlalchemy", "pyparsing", "rich.console"],
+    ),
+    ("help", ["help"], {}, ["sqlalchemy", "pyparsing", "rich.markdown"]),
+    ("version", ["version"], {}, ["sqlalchemy", "pyparsing", "rich.markdown"]),
+    ("--version", ["--version"], {}, ["sqlalchemy", "pyparsing", "rich.markdown"]),
+    ("molecules", ["molecules", "--no-pager"], {}, []),
+    ("molecules (cached)", ["molecules", "--no-pager"], {}, ["sqlalchemy"]),
+    ("sources", ["sources", "--no-pager", "--no-cache"], {}, []),
+    ("telescopes", ["telescopes", "--no-pager", "--no-cache"], {}, []),
+    ("find", ["find", "cyano", "--no-pager"], {}, []),
+    ("export", ["sources", "--format", "jsonl"], {}, ["rich.console"]),
+]
+
+
+def importtime(
+    args: List[str],
+    env: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+
+    """"""
+
+    code = "\n".join(
+        [
+            "import sys",
+            "from spacetar.terminal import main",
+            f"main({args!r}, prog_name='spacetar')",
+        ]
+    )
+
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    modules: Dict[str, int] = {}
+    total = 0
+    for line in process.stderr.splitlines():
+        match = _line.match(line)
+        if match:
+            _, cumulative, depth, name = match.groups()
+            modules[name] = int(cumulative)
+            if not depth:
+                total += int(cumulative)
+
+    return {
+        "seconds": elapsed,
+        "imports": total / 1e6,
+        "modules": modules,
+        "heavy": [_ for _ in _heavy if _ in modules],
+    }
+
+
+def benchmark(
+    commands: List[Tuple[str, List[str], Dict[str, str], List[str]]] = commands,
+) -> List[Dict[str, Any]]:
+
+    """"""
+
+    timings = []
+    with tempfile.TemporaryDirectory() as folder:
+        for name, args, env, forbidden in commands:
+            timing = importtime(args, env={"SPACETAR_CACHE_DIR": folder, **env})
+            timings.append(
+                {
+                    "command": name,
+                    **timing,
+                    "failures": [_ for _ in forbidden if _ in timing["modules"]],
+                }
+            )
+    return timings
+
+
+def main() -> None:
+
+    """"""
+
+    from rich.table import Table
+    from rich.console import Console
+
+    console = Console()
+    timings = benchmark()
+
+    table = Table(title="[u]Cold start of spacetar subcommands[/]")
+    table.add_column("Command", justify="left")
+    table.add_column("Wall time (ms)", justify="right")
+    table.add_column("Import time (ms)", justify="right")
+    table.add_column("Heavy modules", justify="left")
+
+    for timing in timings:
+        table.add_row(
+            f"[b]{timing['command']}[/]",
+            f"{timing['seconds'] * 1e3:.0f}",
+            f"{timing['imports'] * 1e3:.0f}",
+            ", ".join(
+                [
+                    f"[red]{_}[/]" if _ in timing["failures"] else _
+                    for _ in timing["heavy"]
+                ]
+            ),
+        )
+    console.print(table)
+
+    failures = [_ for _ in timings if _["failures"]]
+    console.print(
+        f"[b]Benchmarked[/] {len(timings)} subcommands: "
+        + (
+            "[green]OK[/]."
+            if not failures
+            else f"[red]{len(failures)} imported modules they should not[/]."
+        )
+    )
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
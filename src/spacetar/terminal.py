@@ -1,26 +1,140 @@
 import sys
 import click
+import pathlib
 
-from .core import _bands
+from typing import Dict, Callable, Iterable, Optional
 
-from .search import (
-    search_source,
-    search_molecule,
-    search_telescope,
-)
+from .constants import _bands
 
-from .display import (
-    console,
-    render_help,
-    render_usage,
-    render_version,
-    summarize_source,
-    tabulate_sources,
-    summarize_molecule,
-    tabulate_molecules,
-    summarize_telescope,
-    tabulate_telescopes,
-)
+
+def _nothing(kind: str, name: Optional[str]) -> None:
+
+    """"""
+
+    from .screens import console
+    from .search import search_fuzzy
+
+    matches = search_fuzzy(name, kind=kind) if name else []
+    if matches:
+        console.print(
+            "Nothing to show. Did you mean: "
+            + ", ".join([f"[b]{_.name}[/] ({_.score:.2f})" for _ in matches])
+            + "?"
+        )
+    else:
+        console.print("Nothing to show. Maybe try again with `--like`")
+    sys.exit(0)
+
+
+def _closest(kind: str, kwargs: Dict) -> Dict:
+
+    """"""
+
+    from .search import search_fuzzy
+
+    if kwargs.pop("fuzzy") and kwargs["name"]:
+        matches = search_fuzzy(kwargs["name"], kind=kind, k=1)
+        if matches:
+            kwargs.update(name=matches[0].name, like=False)
+    return kwargs
+
+
+def _screen(
+    command: str,
+    kwargs: Dict,
+    draw: Callable[[], Iterable],
+    no_pager: bool = False,
+    no_cache: bool = False,
+) -> None:
+
+    """"""
+
+    from .screens import show, render, screen_key, read_screen, write_screen
+
+    key = screen_key(command, kwargs)
+    texts = None if no_cache else read_screen(key)
+    if texts is None:
+        texts = (render(_) for _ in draw())
+        if not no_cache:
+            texts = write_screen(key, texts)
+    show(texts, no_pager=no_pager)
+
+
+def _paginate(kwargs: Dict) -> Dict:
+
+    """"""
+
+    kwargs = dict(kwargs)
+    limit, page = kwargs.pop("limit"), kwargs.pop("page")
+    if limit is None:
+        if page != 1:
+            raise click.UsageError("--page needs a page size, set with --limit.")
+        return kwargs
+    return {**kwargs, "limit": limit, "offset": (page - 1) * limit}
+
+
+def _export(
+    kind: str,
+    kwargs: Dict,
+    format: str,
+    fields: Optional[str],
+    output: Optional[pathlib.Path],
+) -> None:
+
+    """"""
+
+    from . import search
+    from .export import schema, writer
+
+    export = getattr(search, f"export_{kind[:-1]}")
+    columns = [_.strip() for _ in fields.split(",")] if fields else None
+    binary = format == "parquet"
+
+    try:
+        writer(format)
+        schema(search._models[kind], columns)
+    except (ValueError, ImportError) as error:
+        raise click.ClickException(str(error))
+
+    try:
+        if output is not None:
+            file = output.open("wb") if binary else output.open("w", newline="")
+            with file:
+                export(file, format=format, fields=columns, **kwargs)
+        else:
+            export(
+                sys.stdout.buffer if binary else sys.stdout,
+                format=format,
+                fields=columns,
+                **kwargs,
+            )
+    except (ValueError, ImportError) as error:
+        if output is not None:
+            output.unlink(missing_ok=True)
+        raise click.ClickException(str(error))
+    sys.exit(0)
+
+
+def _formats(function: Callable) -> Callable:
+
+    """"""
+
+    function = click.option(
+        "--output",
+        type=click.Path(dir_okay=False, writable=True, path_type=pathlib.Path),
+        default=None,
+    )(function)
+    function = click.option("--fields", type=str, default=None)(function)
+    function = click.option("--page", type=click.IntRange(min=1), default=1)(function)
+    function = click.option("--limit", type=click.IntRange(min=0), default=None)(
+        function
+    )
+    function = click.option(
+        "--format",
+        type=click.Choice(["table", "jsonl", "csv", "parquet"], case_sensitive=False),
+        default="table",
+    )(function)
+    return function
 
 
 @click.group(invoke_without_command=True)
@@ -31,10 +145,14 @@ def main(**kwargs):
     """"""
 
     if kwargs["help"]:
+        from .screens import render_help
+
         render_help()
         sys.exit(0)
 
     if kwargs["version"]:
+        from .screens import render_version
+
         render_version()
         sys.exit(0)
 
@@ -44,6 +162,8 @@ def help():
 
     """"""
 
+    from .screens import render_help
+
     render_help()
     sys.exit(0)
 
@@ -53,6 +173,8 @@ def version():
 
     """"""
 
+    from .screens import render_version
+
     render_version()
     sys.exit(0)
 
@@ -73,13 +195,18 @@ def usage(kind: str):
 
     """"""
 
+    from .screens import render_usage
+
     render_usage(kind=kind)
     sys.exit(0)
 
 
 @main.command()
 @click.option("--like", is_flag=True, default=False)
+@click.option("--fuzzy", is_flag=True, default=False)
 @click.option("--no-pager", is_flag=True, default=False)
+@click.option("--no-cache", is_flag=True, default=False)
+@_formats
 @click.option("--name", type=str, default=None)
 @click.option("--formula", type=str, default=None)
 @click.option("--year", multiple=True, type=int, default=None)
@@ -109,25 +236,41 @@ def molecules(**kwargs) -> None:
     """"""
 
     no_pager = kwargs.pop("no_pager")
-    molecules = search_molecule(**kwargs)
-    if len(molecules) == 0:
-        console.print("Nothing to show. Maybe try again with `--like`")
-        sys.exit(0)
-    if len(molecules) == 1:
-        to_display = summarize_molecule(molecules[0])
-    if len(molecules) > 1:
-        to_display = tabulate_molecules(molecules)
-
-    if no_pager:
-        console.print(to_display)
-    else:
-        with console.pager(styles=True):
-            console.print(to_display)
+    no_cache = kwargs.pop("no_cache")
+    format = kwargs.pop("format").lower()
+    fields = kwargs.pop("fields")
+    output = kwargs.pop("output")
+
+    if format != "table":
+        _export(
+            "molecules",
+            _closest("molecules", _paginate(kwargs)),
+            format,
+            fields,
+            output,
+        )
+
+    def draw():
+        from .search import search_molecule
+        from .display import summarize_molecule, stream_molecules
+
+        molecules = search_molecule(**_closest("molecules", _paginate(kwargs)))
+        count = molecules.count
+        if count == 0:
+            _nothing("molecules", kwargs["name"])
+        if count == 1:
+            return [summarize_molecule(molecules[0])]
+        return stream_molecules(molecules.stream(), count=count)
+
+    _screen("molecules", kwargs, draw, no_pager=no_pager, no_cache=no_cache)
 
 
 @main.command()
 @click.option("--like", is_flag=True, default=False)
+@click.option("--fuzzy", is_flag=True, default=False)
 @click.option("--no-pager", is_flag=True, default=False)
+@click.option("--no-cache", is_flag=True, default=False)
+@_formats
 @click.option("--name", type=str, default=None)
 @click.option("--kind", type=str, default=None)
 @click.option("--detects", type=int, multiple=True, default=None)
@@ -136,25 +279,39 @@ def sources(**kwargs) -> None:
     """"""
 
     no_pager = kwargs.pop("no_pager")
-    sources = search_source(**kwargs)
-    if len(sources) == 0:
-        console.print("Nothing to show. Maybe try again with `--like`")
-        sys.exit(0)
-    if len(sources) == 1:
-        to_display = summarize_source(sources[0])
-    if len(sources) > 1:
-        to_display = tabulate_sources(sources)
+    no_cache = kwargs.pop("no_cache")
+    format = kwargs.pop("format").lower()
+    fields = kwargs.pop("fields")
+    output = kwargs.pop("output")
 
-    if no_pager:
-        console.print(to_display)
-    else:
-        with console.pager(styles=True):
-            console.print(to_display)
+    if format != "table":
+        _export(
+            "sources", _closest("sources", _paginate(kwargs)), format, fields, output
+        )
+
+    def draw():
+        from .search import search_source
+        from .display import summarize_source, stream_sources
+
+        arguments = _closest("sources", _paginate(kwargs))
+        sources = search_source(**arguments)
+        count = sources.count
+        if count == 0:
+            _nothing("sources", kwargs["name"])
+        if count == 1:
+            include = ["molecules"]
+            return [summarize_source(search_source(include=include, **arguments)[0])]
+        return stream_sources(sources.stream(), count=count)
+
+    _screen("sources", kwargs, draw, no_pager=no_pager, no_cache=no_cache)
 
 
 @main.command()
 @click.option("--like", is_flag=True, default=False)
+@click.option("--fuzzy", is_flag=True, default=False)
 @click.option("--no-pager", is_flag=True, default=False)
+@click.option("--no-cache", is_flag=True, default=False)
+@_formats
 @click.option("--name", type=str, default=None)
 @click.option("--kind", type=str, default=None)
 @click.option(
@@ -174,17 +331,111 @@ def telescopes(**kwargs):
     """"""
 
     no_pager = kwargs.pop("no_pager")
-    telescopes = search_telescope(**kwargs)
-    if len(telescopes) == 0:
-        console.print("Nothing to show. Maybe try again with `--like`")
+    no_cache = kwargs.pop("no_cache")
+    format = kwargs.pop("format").lower()
+    fields = kwargs.pop("fields")
+    output = kwargs.pop("output")
+
+    if format != "table":
+        _export(
+            "telescopes",
+            _closest("telescopes", _paginate(kwargs)),
+            format,
+            fields,
+            output,
+        )
+
+    def draw():
+        from .search import search_telescope
+        from .display import summarize_telescope, stream_telescopes
+
+        arguments = _closest("telescopes", _paginate(kwargs))
+        telescopes = search_telescope(**arguments)
+        count = telescopes.count
+        if count == 0:
+            _nothing("telescopes", kwargs["name"])
+        if count == 1:
+            include = ["molecules", "wavelengths"]
+            return [
+                summarize_telescope(search_telescope(include=include, **arguments)[0])
+            ]
+        return stream_telescopes(telescopes.stream(), count=count)
+
+    _screen("telescopes", kwargs, draw, no_pager=no_pager, no_cache=no_cache)
+
+
+@main.command()
+@click.argument("query", nargs=-1, required=True)
+@click.option("--no-pager", is_flag=True, default=False)
+@click.option(
+    "--kind",
+    type=click.Choice(
+        [
+            "molecules",
+            "sources",
+            "telescopes",
+        ],
+        case_sensitive=False,
+    ),
+    default=None,
+)
+@click.option("--limit", type=int, default=25)
+def find(**kwargs):
+
+    """"""
+
+    from .screens import console
+    from .search import search_text
+    from .display import tabulate_matches
+
+    no_pager = kwargs.pop("no_pager")
+    matches = search_text(" ".join(kwargs.pop("query")), **kwargs)
+    if len(matches) == 0:
+        console.print("Nothing to show. Maybe try again with fewer words?")
         sys.exit(0)
-    if len(telescopes) == 1:
-        to_display = summarize_telescope(telescopes[0])
-    if len(telescopes) > 1:
-        to_display = tabulate_telescopes(telescopes)
+    to_display = tabulate_matches(matches)
 
     if no_pager:
         console.print(to_display)
     else:
         with console.pager(styles=True):
             console.print(to_display)
+
+
+@main.command()
+@click.option(
+    "--sources",
+    type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path),
+    default=None,
+)
+@click.option(
+    "--telescopes",
+    type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path),
+    default=None,
+)
+@click.option(
+    "--molecules",
+    type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path),
+    default=None,
+)
+def sync(**kwargs):
+
+    """"""
+
+    from .screens import console
+    from .core import _sync_database
+    from .display import summarize_changes
+
+    console.print(summarize_changes(_sync_database(**kwargs)))
+    sys.exit(0)
+
+
+@main.command()
+def clear():
+
+    """"""
+
+    from .screens import console, clear_screens
+
+    console.print(f"[b]Cleared[/] {clear_screens()} cached screen(s).")
+    sys.exit(0)
@@ -0,0 +1,74 @@
+import time
+import asyncio
+import pytest
+
+from spacetar import aio
+from spacetar import search_text, search_source, search_molecule, search_telescope
+
+
+@pytest.fixture
+def workers():
+
+    """"""
+
+    yield aio.configure
+    aio.configure()
+
+
+def test_searches():
+
+    """"""
+
+    async def searches():
+        return await asyncio.gather(
+            aio.search_molecule(source="TMC-1"),
+            aio.search_source(kind="Dark Cloud"),
+            aio.search_telescope(wavelength="UV", fields=["name"]),
+            aio.search_text("cyano", limit=5),
+        )
+
+    molecules, sources, telescopes, matches = asyncio.run(searches())
+
+    assert [_.id for _ in molecules] == [_.id for _ in search_molecule(source="TMC-1")]
+    assert [_.id for _ in sources] == [_.id for _ in search_source(kind="Dark Cloud")]
+    assert [_.name for _ in telescopes] == [
+        _.name for _ in search_telescope(wavelength="UV")
+    ]
+    assert [_.id for _ in matches] == [_.id for _ in search_text("cyano", limit=5)]
+
+
+def test_gather(workers):
+
+    """"""
+
+    workers(2)
+    searches = [{"year": [year], "cached": False} for year in range(1960, 2000)]
+    results = asyncio.run(aio.gather_molecules(searches))
+
+    assert len(results) == len(searches)
+    for kwargs, found in zip(searches, results):
+        assert all([_.year == kwargs["year"][0] for _ in found])
+
+    assert asyncio.run(aio.gather_sources([{"name": "Sgr B2"}]))[0][0].name == "Sgr B2"
+    assert asyncio.run(aio.gather_telescopes([])) == []
+
+
+def test_loop():
+
+    """"""
+
+    async def ticking():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await aio.run(time.sleep, 0.2)
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(ticking()) > 10
@@ -0,0 +1,266 @@
+import json
+import pytest
+import sqlite3
+
+import spacetar.core as core
+
+from spacetar import search_text, search_source
+from spacetar.chimie import composition
+from spacetar.core import _data, _records
+from spacetar.constants import _bands
+
+
+@pytest.mark.parametrize("name", ["sources", "telescopes", "molecules"])
+@pytest.mark.parametrize("size", [7, 1 << 16])
+def test_records(name, size):
+
+    """"""
+
+    path = _data / f"{name}.json"
+
+    assert list(_records(path, size=size)) == list(
+        json.loads(path.read_text()).values()
+    )
+
+
+def test_derived():
+
+    """"""
+
+    with sqlite3.connect(
+        f"{core.connections.database.resolve().as_uri()}?mode=ro", uri=True
+    ) as connection:
+        connection.row_factory = sqlite3.Row
+        rows = connection.execute("SELECT * FROM molecules").fetchall()
+    connection.close()
+
+    assert len(rows) > 0
+    for row in rows:
+        derived = core._derived(row["formula"], row["A"], row["B"], row["C"])
+        stored = {
+            key: (bool(row[key]) if isinstance(value, bool) else row[key])
+            for key, value in derived.items()
+        }
+        assert stored == pytest.approx(derived, nan_ok=True), row["formula"]
+        assert row["natoms"] == sum(
+            natoms for Z, natoms in composition(row["formula"]).items() if Z != 0
+        )
+
+
+def test_create(tmp_path):
+
+    """"""
+
+    data = {
+        name: json.loads((_data / f"{name}.json").read_text())
+        for name in ["sources", "telescopes", "molecules"]
+    }
+    known = {
+        "sources": {_["name"] for _ in data["sources"].values()},
+        "telescopes": {_["name"] for _ in data["telescopes"].values()},
+        "wavelengths": set(_bands),
+    }
+    links = {_["label"]: core._links(_) for _ in data["molecules"].values()}
+    pairs = {
+        table: {
+            (label, name)
+            for label, linked in links.items()
+            for name in linked[kind]
+            if name in known[kind]
+        }
+        for table, kind in [
+            ("assoc_mol_src", "sources"),
+            ("assoc_mol_tel", "telescopes"),
+            ("assoc_mol_wave", "wavelengths"),
+        ]
+    }
+    pairs["assoc_tel_wave"] = {
+        (_["name"], __)
+        for _ in data["telescopes"].values()
+        for __ in _["wavelengths"]
+        if __ in known["wavelengths"]
+    }
+
+    settings = dict(core.connections.settings)
+    try:
+        core.connections.configure(database=tmp_path / "created.db")
+        stats = core._create_database(batch=7)
+    finally:
+        core.connections.configure(**settings)
+
+    with sqlite3.connect(tmp_path / "created.db") as connection:
+        counts = {
+            table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ["sources", "telescopes", "molecules", "wavelengths", *pairs]
+        }
+        unique = {
+            table: connection.execute(
+                f"SELECT COUNT(*) FROM (SELECT DISTINCT {left}, {right} FROM {table})"
+            ).fetchone()[0]
+            for table, left, right in [
+                ("assoc_mol_src", "mol_id", "src_id"),
+                ("assoc_mol_tel", "mol_id", "tel_id"),
+                ("assoc_mol_wave", "mol_id", "wave_id"),
+                ("assoc_tel_wave", "tel_id", "wave_id"),
+            ]
+        }
+    connection.close()
+
+    for name in ["sources", "telescopes", "molecules"]:
+        assert counts[name] == len(data[name])
+    assert counts["wavelengths"] == len(_bands)
+    for table, expected in pairs.items():
+        assert counts[table] == unique[table] == len(expected)
+
+    assert {_: stats[_] for _ in counts} == counts
+    assert stats["total"] == sum(
+        stats[_.name] for _ in core.Base.metadata.sorted_tables
+    )
+    assert stats["seconds"] > 0
+    assert stats["rate"] == pytest.approx(stats["total"] / stats["seconds"])
+
+
+def test_formats(tmp_path):
+
+    """"""
+
+    records = [{"name": "a", "n": 10}, {"name": "b", "n": [1, {"c": "}"}]}]
+
+    array = tmp_path / "records.json"
+    array.write_text(json.dumps(records, indent=4))
+
+    lines = tmp_path / "records.jsonl"
+    lines.write_text("\n".join([json.dumps(_) for _ in records]) + "\n")
+
+    assert list(_records(array, size=3)) == records
+    assert list(_records(lines)) == records
+
+    broken = tmp_path / "broken.json"
+    broken.write_text(json.dumps(records)[:-5])
+
+    with pytest.raises(ValueError):
+        list(_records(broken, size=3))
+
+
+def snapshot(database):
+
+    """"""
+
+    connection = sqlite3.connect(database)
+
+    def named(table, left, right):
+        return sorted(
+            connection.execute(
+                f"""
+                SELECT {left[0]}.{left[1]}, {right[0]}.{right[1]}
+                FROM {table}
+                JOIN {left[0]} ON {left[0]}.id = {table}.{left[2]}
+                JOIN {right[0]} ON {right[0]}.id = {table}.{right[2]}
+                """
+            ).fetchall()
+        )
+
+    tables = {
+        table: sorted(
+            [
+                row[1:]
+                for row in connection.execute(f"SELECT * FROM {table}").fetchall()
+            ],
+            key=repr,
+        )
+        for table in ["molecules", "sources", "telescopes", "wavelengths"]
+    }
+
+    tables["hashes"] = sorted(connection.execute("SELECT * FROM hashes").fetchall())
+    tables["fulltext"] = sorted(
+        connection.execute(
+            "SELECT entity, name, alias, category, formula, notes, refs FROM fulltext"
+        ).fetchall(),
+        key=repr,
+    )
+    tables["assoc_mol_src"] = named(
+        "assoc_mol_src",
+        ("molecules", "label", "mol_id"),
+        ("sources", "name", "src_id"),
+    )
+    tables["assoc_mol_tel"] = named(
+        "assoc_mol_tel",
+        ("molecules", "label", "mol_id"),
+        ("telescopes", "name", "tel_id"),
+    )
+    tables["assoc_mol_wave"] = named(
+        "assoc_mol_wave",
+        ("molecules", "label", "mol_id"),
+        ("wavelengths", "name", "wave_id"),
+    )
+    tables["assoc_tel_wave"] = named(
+        "assoc_tel_wave",
+        ("telescopes", "name", "tel_id"),
+        ("wavelengths", "name", "wave_id"),
+    )
+
+    connection.close()
+    return tables
+
+
+def test_sync(tmp_path):
+
+    """"""
+
+    settings = dict(core.connections.settings)
+    try:
+        _sync(tmp_path)
+    finally:
+        core.connections.configure(**settings)
+
+
+def _sync(tmp_path):
+
+    """"""
+
+    paths = {}
+    for name in ["sources", "telescopes", "molecules"]:
+        paths[name] = tmp_path / f"{name}.json"
+        paths[name].write_text((_data / f"{name}.json").read_text())
+
+    packaged = core.connections.database.stat().st_mtime_ns
+    core.connections.configure(database=tmp_path / "synced.db")
+    core._create_database(**paths)
+
+    stamp = core._stamp()
+    changes = core._sync_database(**paths)
+
+    assert all(not any(_.values()) for _ in changes.values())
+    assert core._stamp() == stamp
+
+    sources = json.loads(paths["sources"].read_text())
+    sources["999"] = {**sources["1"], "name": "Nowhere"}
+    sources["1"] = {**sources["1"], "kind": "Somewhere"}
+    paths["sources"].write_text(json.dumps(sources))
+
+    telescopes = json.loads(paths["telescopes"].read_text())
+    removed = telescopes.pop("2")["name"]
+    paths["telescopes"].write_text(json.dumps(telescopes))
+
+    molecules = json.loads(paths["molecules"].read_text())
+    molecules["3"] = {**molecules["3"], "formula": "CH3OH", "wavelengths": ["IR"]}
+    molecules["999"] = {**molecules["1"], "label": "X", "sources": ["Nowhere"]}
+    del molecules["5"]
+    paths["molecules"].write_text(json.dumps(molecules))
+
+    changes = core._sync_database(**paths)
+
+    assert changes["sources"]["added"] == ["Nowhere"]
+    assert changes["sources"]["updated"] == [sources["1"]["name"]]
+    assert changes["telescopes"]["removed"] == [removed]
+    assert changes["molecules"]["added"] == ["X"]
+    assert changes["molecules"]["updated"] == [molecules["3"]["label"]]
+    assert len(changes["molecules"]["removed"]) == 1
+    assert [_.name for _ in search_source(name="Nowhere")] == ["Nowhere"]
+    assert [_.name for _ in search_text("Nowhere", kind="sources")] == ["Nowhere"]
+
+    core.connections.configure(database=tmp_path / "rebuilt.db")
+    core._create_database(**paths)
+
+    assert snapshot(tmp_path / "synced.db") == snapshot(tmp_path / "rebuilt.db")
+    assert core._database.stat().st_mtime_ns == packaged
@@ -0,0 +1,118 @@
+import os
+import time
+import pytest
+import shutil
+
+import spacetar.core as core
+
+from spacetar import search_molecule
+from spacetar.cache import ResultCache, results
+from spacetar.search import molecule_query
+
+
+def test_key():
+
+    """"""
+
+    cache = ResultCache()
+
+    assert cache.key(molecule_query, name="CO") == cache.key(
+        molecule_query, False, "CO"
+    )
+    assert cache.key(molecule_query, year=[1990]) == cache.key(
+        molecule_query, year=(1990,)
+    )
+    assert cache.key(molecule_query, name="CO") != cache.key(molecule_query)
+
+
+def test_lru():
+
+    """"""
+
+    cache = ResultCache(maxsize=2)
+
+    for key in ["a", "a", "b", "c", "a"]:
+        assert cache.get(key, lambda: key.upper()) == key.upper()
+
+    info = cache.info()
+
+    assert info["hits"] == 1
+    assert info["misses"] == 4
+    assert info["evictions"] == 2
+    assert info["currsize"] == 2
+
+
+def test_ttl():
+
+    """"""
+
+    cache = ResultCache(ttl=0.01)
+
+    cache.get("a", lambda: 1)
+    time.sleep(0.02)
+
+    assert cache.get("a", lambda: 2) == 2
+    assert cache.info()["evictions"] == 1
+
+
+def test_invalidation(tmp_path, monkeypatch):
+
+    """"""
+
+    database = tmp_path / "spacetar.db"
+    shutil.copy(core._database, database)
+    monkeypatch.setitem(core.connections.settings, "database", database)
+
+    cache = ResultCache()
+
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("a", lambda: 2) == 1
+
+    os.utime(database, ns=(0, 0))
+
+    assert cache.get("a", lambda: 3) == 3
+    assert cache.info()["invalidations"] == 1
+
+
+def test_search():
+
+    """"""
+
+    results.clear()
+
+    first = search_molecule(source="TMC-1", records=True)
+    second = search_molecule(source="TMC-1", records=True)
+
+    assert first == second
+    assert first is not second
+    assert results.info()["hits"] == 1
+    assert results.info()["misses"] == 1
+
+    search_molecule(source="TMC-1", records=True, cached=False)
+    search_molecule(source="TMC-1").all()
+
+    assert results.info()["misses"] == 1
+
+    search_molecule(source="TMC-1", cached=True).all()
+
+    assert results.info()["misses"] == 2
+
+
+def test_isolation():
+
+    """"""
+
+    first = search_molecule(formula="CO")[0]
+    first.name = "MUTATED"
+    first.sources.clear()
+
+    second = search_molecule(formula="CO")[0]
+
+    assert second is not first
+    assert second.name == "carbon monoxide"
+    assert len(second.sources) > 0
+
+    record = search_molecule(formula="CO", records=True)[0]
+    with pytest.raises(AttributeError):
+        record.name = "MUTATED"
+    assert search_molecule(formula="CO", records=True)[0].name == "carbon monoxide"
@@ -0,0 +1,112 @@
+import json
+import pytest
+
+from spacetar.core import _data
+from spacetar.chimie import (
+    FormulaEngine,
+    composition,
+    compositions,
+    _fast_parser,
+    _formula_parser,
+    _partition_formula,
+)
+
+
+grammar = _formula_parser()
+formulas = sorted(
+    {_["formula"] for _ in json.loads((_data / "molecules.json").read_text()).values()}
+)
+
+
+def test_composition():
+
+    """"""
+
+    assert composition("(CH3)2CO") == {6: 3, 1: 6, 8: 1}
+    assert composition("CH+") == {6: 1, 1: 1, 0: 1}
+    assert composition("C6H-") == {6: 6, 1: 1, 0: -1}
+    assert composition("c-C3H2") == {6: 3, 1: 2}
+
+
+def test_compositions():
+
+    """"""
+
+    formulas = ["CO", "HCN", "CO", "H3O+"]
+
+    assert compositions(formulas) == [composition(_) for _ in formulas]
+
+
+def test_memo():
+
+    """"""
+
+    engine = FormulaEngine(maxsize=2)
+
+    engine.parse("CO")
+    engine.parse("CO")
+    engine.parse("HCN")
+    engine.parse("H2O")
+
+    info = engine.info()
+
+    assert info["hits"] == 1
+    assert info["misses"] == 3
+    assert info["currsize"] == 2
+
+    engine.parse("CO")
+
+    assert engine.misses == 4
+
+    engine.resize(1)
+
+    assert engine.info()["currsize"] == 1
+
+    engine.clear()
+
+    assert engine.info() == {"hits": 0, "misses": 0, "maxsize": 1, "currsize": 0}
+
+
+def test_isolation():
+
+    """"""
+
+    engine = FormulaEngine()
+
+    engine.parse("CO")[6] = 100
+
+    assert engine.parse("CO") == {6: 1, 8: 1}
+
+
+@pytest.mark.parametrize("formula", formulas)
+def test_fast_parser(formula):
+
+    """"""
+
+    _, stoich_str, _ = _partition_formula(formula)
+
+    fast = _fast_parser(stoich_str)
+
+    if fast is not None:
+        assert fast == [tuple(_) for _ in grammar.parseString(stoich_str)]
+    assert FormulaEngine().parse(formula) == FormulaEngine(fast=False).parse(formula)
+
+
+@pytest.mark.parametrize(
+    "formula, fast",
+    [
+        ("C H3", False),
+        ("CH3)", False),
+        ("C(H", False),
+        ("NH3D", False),
+        ("C2(OH)", True),
+    ],
+)
+def test_fallback(formula, fast):
+
+    """"""
+
+    _, stoich_str, _ = _partition_formula(formula)
+
+    assert (_fast_parser(stoich_str) is not None) == fast
+    assert FormulaEngine().parse(formula) == FormulaEngine(fast=False).parse(formula)
@@ -0,0 +1,34 @@
+from rich.console import Console
+
+import spacetar.screens as screens
+
+from spacetar.search import search_source
+from spacetar.display import stream_sources
+
+
+def test_stream(tmp_path, monkeypatch):
+
+    """"""
+
+    sources = search_source()
+    console = Console(width=100, color_system=None)
+
+    with console.capture() as capture:
+        for table in stream_sources(sources, chunk=7):
+            console.print(table)
+    lines = capture.get().splitlines()
+
+    assert sum([_.startswith("┏") for _ in lines]) == 1
+    assert sum([_.startswith("└") for _ in lines]) == 1
+    assert sum([_.startswith("├") for _ in lines]) == len(sources) - 1
+    assert f"{len(sources)} out of a total of" in lines[0]
+
+    monkeypatch.setattr(screens, "_folder", tmp_path)
+
+    partial = screens.write_screen("partial", ["a", "b"])
+    assert next(partial) == "a"
+    partial.close()
+    assert screens.load_screen("partial") is None
+
+    assert list(screens.write_screen("full", ["a", "b"])) == ["a", "b"]
+    assert screens.load_screen("full") == "ab"
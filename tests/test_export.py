@@ -0,0 +1,147 @@
+import io
+import csv
+import json
+import pytest
+
+import spacetar.export as export
+
+from spacetar.core import Source, Telescope
+from spacetar import (
+    search_source,
+    export_source,
+    search_molecule,
+    export_molecule,
+    search_telescope,
+    export_telescope,
+)
+
+
+@pytest.mark.parametrize(
+    "search, export, kwargs",
+    [
+        (search_molecule, export_molecule, {}),
+        (search_molecule, export_molecule, {"source": "TMC-1"}),
+        (search_source, export_source, {"kind": "Dark Cloud"}),
+        (search_telescope, export_telescope, {"wavelength": "UV"}),
+    ],
+)
+def test_jsonl(search, export, kwargs):
+
+    """"""
+
+    streamed = io.StringIO()
+    exported = io.StringIO()
+
+    count = export(streamed, **kwargs)
+    results = search(**kwargs)
+
+    assert count == len(results)
+    assert results.to_jsonl(exported) == count
+    assert streamed.getvalue() == exported.getvalue()
+    assert search(records=True, **kwargs).to_jsonl(io.StringIO()) == count
+
+
+def test_fields():
+
+    """"""
+
+    file = io.StringIO()
+    export_source(file, format="csv", fields=["name", "detects", "molecules"])
+    rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+
+    assert list(rows[0]) == ["name", "detects", "molecules"]
+    assert rows[0]["name"] == search_source()[0].name
+    assert int(rows[0]["detects"]) == len(rows[0]["molecules"].split("; "))
+
+    file = io.StringIO()
+    search_molecule(formula="CO").to_jsonl(file, fields=["formula", "year"])
+    assert json.loads(file.getvalue()) == {"formula": "CO", "year": 1970}
+
+    with pytest.raises(ValueError):
+        export_molecule(io.StringIO(), fields=["bogus"])
+    with pytest.raises(ValueError):
+        export_molecule(io.StringIO(), format="xml")
+
+
+def test_parquet(tmp_path):
+
+    """"""
+
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "telescopes.parquet"
+    count = export_telescope(str(path), format="parquet", fields=["name", "detects"])
+    table = pq.read_table(path)
+
+    assert table.num_rows == count == len(search_telescope())
+    assert table.column_names == ["name", "detects"]
+
+
+def test_empty(tmp_path):
+
+    """"""
+
+    file = io.StringIO()
+    assert export_source(file, format="csv", name="Nowhere") == 0
+    assert file.getvalue().strip() == ",".join(export.fields(Source))
+
+    file = io.StringIO()
+    fields = ["name", "detects", "molecules"]
+    assert search_source(name="Nowhere").most("detects").to_csv(file, fields) == 0
+    assert file.getvalue().strip() == ",".join(fields)
+
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "empty.parquet"
+    assert export_telescope(str(path), format="parquet", name="Nowhere") == 0
+    assert pq.read_table(path).num_rows == 0
+
+
+def test_schema(tmp_path):
+
+    """"""
+
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    rows = [
+        {"name": "First", "decommissioned": None, "molecules": []},
+        {"name": "Second", "decommissioned": 2010, "molecules": ["CO"]},
+    ]
+    fields = ["name", "decommissioned", "molecules"]
+    path = tmp_path / "telescopes.parquet"
+    assert (
+        export.write_parquet(rows, str(path), export.schema(Telescope, fields), 1) == 2
+    )
+
+    table = pq.read_table(path)
+    assert table.schema.field("decommissioned").type == pa.int64()
+    assert table.schema.field("molecules").type == pa.list_(pa.string())
+    assert table.to_pylist() == rows
+
+
+def test_output(tmp_path):
+
+    """"""
+
+    from click.testing import CliRunner
+    from spacetar.terminal import main
+
+    path = tmp_path / "sources.csv"
+    result = CliRunner().invoke(
+        main, ["sources", "--format", "csv", "--fields", "bogus", "--output", path]
+    )
+
+    assert result.exit_code != 0
+    assert not path.exists()
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        path = tmp_path / "sources.parquet"
+        result = CliRunner().invoke(
+            main, ["sources", "--format", "parquet", "--output", path]
+        )
+        assert result.exit_code != 0
+        assert "PyArrow" in result.output
+        assert not path.exists()
@@ -0,0 +1,41 @@
+from spacetar import search_fuzzy
+from spacetar.fuzzy import TrigramIndex, fuzzy_index, trigrams
+
+
+def test_trigrams():
+
+    """"""
+
+    assert trigrams("CO") == {"  c", " co", "co "}
+    assert trigrams("Sgr B2") == trigrams("sgr  b2")
+    assert trigrams("()") == set()
+
+
+def test_top():
+
+    """"""
+
+    index = TrigramIndex(
+        [
+            ("sources", "Sgr B2", "Sgr B2"),
+            ("sources", "Sgr A", "Sgr A"),
+            ("molecules", "methanol", "methanol"),
+            ("molecules", "methanol", "CH3OH"),
+        ]
+    )
+
+    assert len(index) == 4
+    assert index.top("Sgr B2(N)")[0].name == "Sgr B2"
+    assert index.top("ch3oh")[0].score == 1.0
+    assert index.top("sgr", kind="molecules") == []
+    assert [_.name for _ in index.top("methanol", cutoff=0.0)] == ["methanol"]
+
+
+def test_fuzzy():
+
+    """"""
+
+    assert fuzzy_index() is fuzzy_index()
+    assert search_fuzzy("Sgr B2(N)", kind="sources")[0].name == "Sgr B2"
+    assert search_fuzzy("methanl", k=2)[1].name == "methanol"
+    assert search_fuzzy("HC3N")[0].name == "cyanoacetylene"
@@ -0,0 +1,119 @@
+import io
+import json
+import pytest
+
+from click.testing import CliRunner
+
+from spacetar.terminal import main
+from spacetar import search_source, search_molecule, export_source, search_telescope
+
+
+def walk(query, size):
+
+    """"""
+
+    ids, cursor = [], None
+    while True:
+        page = query.page(size, cursor)
+        assert len(page.results) <= size
+        ids.extend([_.id for _ in page.results])
+        if page.cursor is None:
+            return ids
+        cursor = page.cursor
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        lambda: search_molecule(),
+        lambda: search_molecule(source="TMC-1"),
+        lambda: search_molecule(fields=["name"]).orderby("mass", reverse=True),
+        lambda: search_source(records=True),
+        lambda: search_telescope().orderby("diameter"),
+        lambda: search_telescope().orderby("decommissioned", reverse=True),
+    ],
+)
+def test_cursors(query):
+
+    """"""
+
+    expected = [_.id for _ in query()]
+
+    assert walk(query(), 7) == expected
+    assert walk(query(), len(expected)) == expected
+
+
+def test_limits():
+
+    """"""
+
+    ids = [_.id for _ in search_molecule()]
+
+    assert [_.id for _ in search_molecule(limit=5)] == ids[:5]
+    assert [_.id for _ in search_molecule(limit=5, offset=10)] == ids[10:15]
+    assert [_.id for _ in search_molecule().offset(230).limit(20)] == ids[230:]
+
+    file = io.StringIO()
+    export_source(file, fields=["id"], limit=3, offset=1)
+    assert [json.loads(_)["id"] for _ in file.getvalue().splitlines()] == [
+        _.id for _ in search_source()
+    ][1:4]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        lambda: search_molecule(),
+        lambda: search_molecule(limit=20, offset=5),
+        lambda: search_source(kind="Dark Cloud").offset(3),
+        lambda: search_telescope().filter(lambda _: _.built),
+    ],
+)
+def test_stream(query):
+
+    """"""
+
+    expected = [_.id for _ in query()]
+    streamed = query()
+
+    assert streamed.count == len(expected)
+    assert [_.id for _ in streamed.stream(6)] == expected
+    assert streamed._results is None or streamed._steps
+
+
+def test_invalid():
+
+    """"""
+
+    cursor = search_molecule().page(5).cursor
+
+    with pytest.raises(ValueError):
+        search_molecule().orderby("mass").page(5, cursor)
+    with pytest.raises(ValueError):
+        search_molecule()[5:].page(5)
+    with pytest.raises(ValueError):
+        search_molecule().filter(lambda _: True).page(5)
+
+
+def test_cli():
+
+    """"""
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "sources",
+            "--format",
+            "jsonl",
+            "--fields",
+            "name",
+            "--limit",
+            "2",
+            "--page",
+            "3",
+        ],
+    )
+    names = [json.loads(_)["name"] for _ in result.output.splitlines()]
+
+    assert names == [_.name for _ in search_source()][4:6]
+    assert CliRunner().invoke(main, ["sources", "--page", "2"]).exit_code == 2
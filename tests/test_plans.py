@@ -0,0 +1,59 @@
+import shutil
+import sqlite3
+import pytest
+
+from spacetar.core import connections
+from spacetar.plans import audit, scans
+
+
+def test_audit():
+
+    """"""
+
+    assert audit() == []
+
+
+@pytest.mark.parametrize(
+    "index, shape",
+    [
+        ("ix_molecules_name", {"name": "acetone"}),
+        ("ix_molecules_formula", {"formula": "CH3COOH"}),
+        ("ix_molecules_year", {"year": [1990, 2000]}),
+        ("ix_molecules_neutral", {"neutral": True}),
+        ("ix_sources_kind", {"kind": "Dark Cloud"}),
+    ],
+)
+def test_dropped(tmp_path, index, shape):
+
+    """"""
+
+    path = tmp_path / "dropped.db"
+    shutil.copy(connections.database, path)
+    with sqlite3.connect(path) as connection:
+        connection.execute(f"DROP INDEX {index}")
+    connection.close()
+
+    settings = dict(connections.settings)
+    try:
+        connections.configure(database=path)
+        failures = audit()
+    finally:
+        connections.configure(**settings)
+
+    assert failures
+    assert shape in [_["kwargs"] for _ in failures]
+
+
+def test_scans():
+
+    """"""
+
+    plan = [
+        (3, 0, "SCAN molecules"),
+        (8, 3, "SCAN assoc_mol_src_1"),
+        (9, 3, "SEARCH assoc_mol_tel USING COVERING INDEX ix_assoc_mol_tel_mol_id"),
+        (12, 0, "SCAN wavelengths"),
+    ]
+
+    assert scans(plan, expected=("molecules",)) == ["SCAN assoc_mol_src_1"]
+    assert scans(plan) == ["SCAN molecules", "SCAN assoc_mol_src_1"]
@@ -0,0 +1,62 @@
+import pytest
+
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm.exc import DetachedInstanceError
+
+from spacetar import search_source, search_molecule, search_telescope
+
+
+@pytest.mark.parametrize(
+    "search, fields, kwargs",
+    [
+        (search_molecule, ["name", "year"], {}),
+        (search_molecule, ["formula"], {"source": "TMC-1"}),
+        (search_source, ["name", "detects"], {}),
+        (search_telescope, ["name", "nick"], {"wavelength": "UV"}),
+    ],
+)
+def test_fields(search, fields, kwargs):
+
+    """"""
+
+    full = search(**kwargs)
+    partial = search(fields=fields, **kwargs)
+
+    assert [_.id for _ in partial] == [_.id for _ in full]
+    for entity, projected in zip(full, partial):
+        for field in fields:
+            assert getattr(projected, field) == getattr(entity, field)
+        with pytest.raises(DetachedInstanceError):
+            projected.notes if search is not search_source else projected.ra
+        with pytest.raises(InvalidRequestError):
+            projected.molecules if search is not search_molecule else projected.sources
+
+
+def test_include():
+
+    """"""
+
+    full = search_molecule(source="TMC-1")
+    partial = search_molecule(fields=["label"], include=["sources"], source="TMC-1")
+
+    for entity, projected in zip(full, partial):
+        assert [_.name for _ in projected.sources] == [_.name for _ in entity.sources]
+        with pytest.raises(InvalidRequestError):
+            projected.telescopes
+        with pytest.raises(InvalidRequestError):
+            projected.sources[0].molecules
+
+    telescopes = search_telescope(include=["wavelengths"])
+    assert [_.notes for _ in telescopes] == [_.notes for _ in search_telescope()]
+
+
+def test_invalid():
+
+    """"""
+
+    with pytest.raises(ValueError):
+        search_molecule(fields=["bogus"])
+    with pytest.raises(ValueError):
+        search_source(include=["telescopes"])
+    with pytest.raises(ValueError):
+        search_telescope(records=True, fields=["name"])
@@ -0,0 +1,109 @@
+import pytest
+import sqlalchemy as sql
+
+from spacetar.core import connections
+from spacetar.search import Query, Results
+from spacetar import search_source, search_molecule, search_telescope
+
+
+@pytest.fixture
+def statements():
+
+    """"""
+
+    captured = []
+
+    def listener(connection, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    sql.event.listen(connections.engine, "before_cursor_execute", listener)
+    yield captured
+    sql.event.remove(connections.engine, "before_cursor_execute", listener)
+
+
+@pytest.mark.parametrize(
+    "search, kwargs, chain",
+    [
+        (search_molecule, {}, lambda _: _.orderby("year")[:20]),
+        (search_molecule, {"source": "TMC-1"}, lambda _: _.orderby("mass", True)[5:9]),
+        (search_molecule, {}, lambda _: _.between("year", [1970, 1980]).most("natoms")),
+        (search_molecule, {}, lambda _: _.search("natoms", 3).least("mass")),
+        (search_molecule, {}, lambda _: _.top_k("mass", 7)),
+        (search_molecule, {"records": True}, lambda _: _.top_k("year", 4, False)),
+        (search_source, {}, lambda _: _.most("detects")),
+        (search_source, {}, lambda _: _.orderby("name")[3:][:4]),
+        (search_telescope, {}, lambda _: _[:10].orderby("detects", reverse=True)),
+        (search_telescope, {}, lambda _: _.filter(lambda t: t.built).orderby("built")),
+        (search_molecule, {}, lambda _: _[::2][-3:]),
+    ],
+)
+def test_chains(search, kwargs, chain):
+
+    """"""
+
+    lazy = chain(search(cached=False, **kwargs))
+    eager = chain(Results(search(cached=False, **kwargs)))
+
+    assert [_.id for _ in lazy] == [_.id for _ in eager]
+
+
+def test_lazy(statements):
+
+    """"""
+
+    query = search_molecule(cached=False).orderby("year")[:20]
+
+    assert isinstance(query, Query)
+    assert statements == []
+    assert len(query) == 20
+    assert "LIMIT" in statements[0]
+
+    count = len(statements)
+    assert query[0] is query.all()[0]
+    assert len(statements) == count
+
+
+def test_arguments(statements):
+
+    """"""
+
+    with pytest.raises(TypeError):
+        search_molecule(nmae="CO")
+    with pytest.raises(TypeError):
+        search_source(True, like=True)
+
+    assert statements == []
+
+
+def test_sequence():
+
+    """"""
+
+    query = search_source(kind="Dark Cloud")
+    results = Results(query)
+
+    assert query == results
+    assert query.count == len(results)
+    assert results[0] in query
+    assert isinstance(query[1:3], Query)
+    assert isinstance(results[1:3], Results)
+    assert not search_source(name="Nowhere")
+
+
+def test_hydration(statements):
+
+    """"""
+
+    sources = search_source(detects=[4, 6], cached=False).all()
+
+    assert len(sources) > 0
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("SELECT")
+
+    telescopes = search_telescope(cached=False).all()
+
+    assert len(telescopes) > 0
+    assert not [_ for _ in statements if "FROM molecules" in _]
+
+    source = search_source(name="Sgr B2", include=["molecules"]).all()[0]
+    assert len(source.molecules) == source.detects
@@ -0,0 +1,68 @@
+import pickle
+import pytest
+
+import spacetar.records as records
+
+from spacetar import search_source, search_molecule, search_telescope
+from spacetar.records import MoleculeRecord, SourceRecord, TelescopeRecord
+
+
+@pytest.mark.parametrize(
+    "search, kwargs",
+    [
+        (search_molecule, {}),
+        (search_molecule, {"source": "TMC-1"}),
+        (search_molecule, {"like": True, "name": "acid"}),
+        (search_source, {}),
+        (search_source, {"kind": "Dark Cloud"}),
+        (search_telescope, {}),
+        (search_telescope, {"wavelength": "UV"}),
+    ],
+)
+def test_records(search, kwargs):
+
+    """"""
+
+    include = {
+        search_source: ["molecules"],
+        search_telescope: ["molecules", "wavelengths"],
+    }.get(search)
+    entities = search(include=include, **kwargs)
+    records = search(records=True, **kwargs)
+
+    assert len(records) == len(entities)
+    for entity, record in zip(entities, records):
+        for field, value in record._asdict().items():
+            if field == "molecules":
+                assert value == tuple([_.label for _ in entity.molecules])
+            elif isinstance(value, tuple):
+                assert value == tuple([_.name for _ in getattr(entity, field)])
+            else:
+                assert value == getattr(entity, field)
+
+
+def test_chunks(monkeypatch):
+
+    """"""
+
+    whole = search_molecule(records=True, cached=False)
+    monkeypatch.setattr(records, "_chunk", 7)
+
+    assert len(whole) > 7
+    assert search_molecule(records=True, cached=False) == whole
+
+
+def test_frozen():
+
+    """"""
+
+    molecule = search_molecule(records=True, name="ethanol")[0]
+
+    assert isinstance(molecule, MoleculeRecord)
+    assert isinstance(search_source(records=True)[0], SourceRecord)
+    assert isinstance(search_telescope(records=True)[0], TelescopeRecord)
+    assert "Sgr B2" in molecule.sources
+    assert pickle.loads(pickle.dumps(molecule)) == molecule
+
+    with pytest.raises(AttributeError):
+        molecule.name = "methanol"
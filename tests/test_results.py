@@ -0,0 +1,90 @@
+import pytest
+
+from spacetar import search_source, search_molecule, search_telescope
+
+
+@pytest.fixture(scope="module")
+def molecules():
+
+    """"""
+
+    return search_molecule()
+
+
+def test_most_least(molecules):
+
+    """"""
+
+    heaviest = max([_.mass for _ in molecules])
+    earliest = min([_.year for _ in molecules])
+
+    assert [_.mass for _ in molecules.most("mass")] == [heaviest]
+    assert all([_.year == earliest for _ in molecules.least("year")])
+    assert molecules.least("year").count == sum([_.year == earliest for _ in molecules])
+    assert search_source().most("detects")[0].name == "Sgr B2"
+
+
+def test_filters(molecules):
+
+    """"""
+
+    between = molecules.between("year", [1970, 1980])
+    assert [_.id for _ in between] == [
+        _.id for _ in molecules if 1970 <= _.year <= 1980
+    ]
+    assert all([_.natoms == 3 for _ in molecules.search("natoms", 3)])
+    assert [_.mass for _ in molecules.orderby("mass", reverse=True)] == sorted(
+        [_.mass for _ in molecules], reverse=True
+    )
+    assert [_.name for _ in between.least("year")] == [
+        _.name for _ in molecules.search("year", 1970)
+    ]
+
+
+def test_top_k(molecules):
+
+    """"""
+
+    top = molecules.top_k("natoms", 5)
+    bottom = molecules.top_k("mass", 3, largest=False)
+
+    assert [_.natoms for _ in top] == sorted([_.natoms for _ in molecules])[::-1][:5]
+    assert [_.mass for _ in bottom] == sorted([_.mass for _ in molecules])[:3]
+    assert search_telescope().top_k("detects", 1)[0].nick == "IRAM 30-m"
+
+
+def test_group_by(molecules):
+
+    """"""
+
+    groups = molecules.group_by("natoms")
+
+    assert sum([_.count for _ in groups.values()]) == molecules.count
+    for natoms, group in groups.items():
+        assert all([_.natoms == natoms for _ in group])
+
+
+def test_columns(molecules):
+
+    """"""
+
+    results = molecules.search("natoms", 2)
+    assert results.column("formula") == [_.formula for _ in results]
+
+    results.append(molecules[-1])
+    assert results.column("formula")[-1] == molecules[-1].formula
+
+    np = pytest.importorskip("numpy")
+    assert np.array_equal(results.array("natoms"), [_.natoms for _ in results])
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_orderby_nulls(reverse):
+
+    """"""
+
+    expected = search_telescope().orderby("decommissioned", reverse)
+    results = search_telescope().all().orderby("decommissioned", reverse)
+
+    assert None in [_.decommissioned for _ in results]
+    assert [_.decommissioned for _ in results] == [_.decommissioned for _ in expected]
@@ -0,0 +1,91 @@
+import sys
+import shutil
+import subprocess
+
+import spacetar.screens as screens
+
+from spacetar.core import connections
+
+
+def test_screens(tmp_path, monkeypatch):
+
+    """"""
+
+    monkeypatch.setattr(screens, "_folder", tmp_path)
+    monkeypatch.setattr(screens, "_limit", 2)
+
+    key = screens.screen_key("molecules", {"name": "CO"})
+
+    assert key == screens.screen_key("molecules", {"name": "CO"})
+    assert key != screens.screen_key("molecules", {"name": "HCN"})
+    assert screens.load_screen(key) is None
+
+    screens.store_screen(key, "\x1b[1mCO\x1b[0m\n")
+
+    assert screens.load_screen(key) == "\x1b[1mCO\x1b[0m\n"
+
+    for _ in ["a", "b", "c"]:
+        screens.store_screen(_, _)
+
+    assert len(list(tmp_path.glob("*.ansi"))) == 2
+    assert screens.clear_screens() == 2
+
+
+def test_configured(tmp_path):
+
+    """"""
+
+    key = screens.screen_key("sources", {})
+    settings = dict(connections.settings)
+    shutil.copy(connections.database, tmp_path / "copy.db")
+    try:
+        connections.configure(database=tmp_path / "copy.db")
+        assert screens.screen_key("sources", {}) != key
+    finally:
+        connections.configure(**settings)
+    assert screens.screen_key("sources", {}) == key
+
+
+def test_cached(tmp_path):
+
+    """"""
+
+    code = "\n".join(
+        [
+            "import sys",
+            "from spacetar.terminal import main",
+            "try:",
+            "    main(['sources', '--no-pager'])",
+            "except SystemExit:",
+            "    pass",
+            "print('sqlalchemy' in sys.modules, file=sys.stderr)",
+        ]
+    )
+
+    runs = [
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={"SPACETAR_CACHE_DIR": str(tmp_path), "PATH": ""},
+            capture_output=True,
+            text=True,
+        )
+        for _ in range(2)
+    ]
+
+    assert runs[0].stdout == runs[1].stdout
+    assert "Sgr B2" in runs[1].stdout
+    assert runs[0].stderr.strip() == "True"
+    assert runs[1].stderr.strip() == "False"
+
+
+def test_pager(monkeypatch, capsys):
+
+    """"""
+
+    monkeypatch.setenv("PAGER", "no-such-pager --flag")
+    monkeypatch.delenv("MANPAGER", raising=False)
+    monkeypatch.setattr(screens.console.file, "isatty", lambda: True)
+
+    assert screens._pager() is None
+    screens.show(iter(["first\n", "second\n"]))
+    assert capsys.readouterr().out == "first\nsecond\n"
@@ -1,4 +1,9 @@
+import pytest
+
+import spacetar.core as core
+
 from spacetar import search_molecule
+from spacetar.search import Results, molecule_query
 
 
 def test_name():
@@ -220,3 +225,28 @@ def test_like():
     assert len(results) == 9
     assert results[0].name == "formic acid"
     assert results[0].formula == "HCOOH"
+
+
+def test_unfiltered():
+
+    """"""
+
+    assert molecule_query().whereclause is None
+    assert len(search_molecule()) == 240
+    assert molecule_query(name="acetone").whereclause.right.value == "acetone"
+
+
+@pytest.mark.parametrize("flag", ["neutral", "cation", "anion", "radical"])
+@pytest.mark.parametrize("value", [True, False])
+def test_charges(flag, value):
+
+    """"""
+
+    where = str(molecule_query(**{flag: value}).whereclause)
+    query = search_molecule(cached=False, **{flag: value})
+    expected = Results(search_molecule(cached=False)).search(flag, value)
+
+    assert f"molecules.{flag}" in where
+    assert query._steps == ()
+    assert [_.id for _ in query] == [_.id for _ in expected]
+    assert all(core._derived(_.formula)[flag] == value for _ in query)
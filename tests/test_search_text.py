@@ -0,0 +1,88 @@
+import pytest
+import sqlalchemy as sql
+
+from sqlalchemy.exc import InvalidRequestError
+
+from spacetar import search_text
+from spacetar.search import text_query
+from spacetar.core import Source, Molecule, connections
+
+
+def test_text():
+
+    """"""
+
+    results = search_text("TMC-1")
+
+    assert len(results) == 1
+    assert results[0].entity == "sources"
+    assert results[0].name == "TMC-1"
+    assert isinstance(results[0].load(), Source)
+
+
+def test_formula():
+
+    """"""
+
+    results = search_text("CH3OH")
+
+    assert results[0].entity == "molecules"
+    assert results[0].name == "methanol"
+    assert results[0].formula == "CH3OH"
+
+
+def test_nick():
+
+    """"""
+
+    results = search_text("GBT", kind="telescopes")
+
+    assert len(results) == 1
+    assert results[0].entity == "telescopes"
+    assert results[0].name == "Green Bank Telescope"
+    assert results[0].alias == "GBT 100-m"
+
+
+def test_ranked():
+
+    """"""
+
+    results = search_text("cyano", limit=5)
+
+    assert len(results) == 5
+    assert all(["cyano" in _.name for _ in results])
+
+
+def test_lightweight():
+
+    """"""
+
+    captured = []
+
+    def listener(connection, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    sql.event.listen(connections.engine, "before_cursor_execute", listener)
+    try:
+        hits = search_text("IRAM")
+    finally:
+        sql.event.remove(connections.engine, "before_cursor_execute", listener)
+
+    assert len(hits) > 0
+    assert len(captured) == 1
+    assert [_.rank for _ in hits] == sorted([_.rank for _ in hits])
+
+    molecule = search_text("CH3OH", kind="molecules")[0].load()
+    assert isinstance(molecule, Molecule)
+    with pytest.raises(InvalidRequestError):
+        molecule.sources
+    assert [_.name for _ in search_text("CH3OH")[0].load(["sources"]).sources]
+
+
+def test_sanitized():
+
+    """"""
+
+    assert text_query("( * )") is None
+    assert search_text('"') == []
+    assert search_text('AND OR NOT "x') == []
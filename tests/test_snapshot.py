@@ -0,0 +1,101 @@
+import pytest
+import shutil
+import sqlite3
+
+from spacetar.core import connections
+from spacetar import search_source, search_molecule, search_telescope
+
+np = pytest.importorskip("numpy")
+
+from spacetar.snapshot import Snapshot, snapshot  # noqa: E402
+
+
+cases = [
+    (search_molecule, "search_molecule", {}),
+    (search_molecule, "search_molecule", {"name": "acetone"}),
+    (search_molecule, "search_molecule", {"like": True, "name": "ACID"}),
+    (search_molecule, "search_molecule", {"formula": "CH3OH"}),
+    (search_molecule, "search_molecule", {"like": True, "name": "e_h"}),
+    (search_molecule, "search_molecule", {"like": True, "formula": "C%N"}),
+    (search_molecule, "search_molecule", {"year": [1990]}),
+    (search_molecule, "search_molecule", {"year": [1990, 2000]}),
+    (search_molecule, "search_molecule", {"source": "TMC-1"}),
+    (search_molecule, "search_molecule", {"like": True, "source": "sgr"}),
+    (search_molecule, "search_molecule", {"telescope": "GBT 100-m"}),
+    (search_molecule, "search_molecule", {"wavelength": "UV"}),
+    (search_molecule, "search_molecule", {"anion": True, "radical": True}),
+    (search_molecule, "search_molecule", {"radical": False, "exgal": True}),
+    (search_source, "search_source", {}),
+    (search_source, "search_source", {"like": True, "kind": "cloud"}),
+    (search_source, "search_source", {"detects": [4, 6]}),
+    (search_telescope, "search_telescope", {}),
+    (search_telescope, "search_telescope", {"name": "GBT 100-m"}),
+    (search_telescope, "search_telescope", {"wavelength": "UV"}),
+    (search_telescope, "search_telescope", {"diameter": [10.0, 40.0]}),
+    (search_telescope, "search_telescope", {"decommissioned": [1970, 1990]}),
+    (search_telescope, "search_telescope", {"detects": [6, 10]}),
+]
+
+
+@pytest.mark.parametrize("search, method, kwargs", cases)
+def test_snapshot(search, method, kwargs):
+
+    """"""
+
+    expected = search(**kwargs)
+    results = getattr(snapshot(), method)(**kwargs)
+
+    assert [_.id for _ in results] == [_.id for _ in expected]
+    assert [_.name for _ in results] == [_.name for _ in expected]
+
+
+def test_entries():
+
+    """"""
+
+    engine = Snapshot()
+
+    assert snapshot() is snapshot()
+
+    molecule = engine.search_molecule(name="ethanol")[0]
+    expected = search_molecule(name="ethanol")[0]
+
+    for name in ["formula", "year", "mass", "radical", "kappa", "composition"]:
+        assert getattr(molecule, name) == getattr(expected, name)
+    for name in ["sources", "telescopes", "wavelengths"]:
+        assert [_.name for _ in getattr(molecule, name)] == [
+            _.name for _ in getattr(expected, name)
+        ]
+
+    telescope = engine.search_telescope(name="GBT 100-m")[0]
+
+    assert telescope.detects == search_telescope(name="GBT 100-m")[0].detects
+    assert [_.label for _ in telescope.molecules] == [
+        _.label
+        for _ in search_telescope(name="GBT 100-m", include=["molecules"])[0].molecules
+    ]
+
+    with pytest.raises(AttributeError):
+        molecule.nothing
+
+
+def test_nulls(tmp_path):
+
+    """"""
+
+    path = tmp_path / "we?ird#%20 nulls.db"
+    shutil.copy(connections.database, path)
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE molecules SET year = NULL WHERE id % 7 = 0")
+    connection.close()
+
+    settings = dict(connections.settings)
+    try:
+        connections.configure(database=path)
+        for kwargs in [{}, {"like": True, "name": "_"}, {"source": "TMC-1"}]:
+            expected = search_molecule(cached=False, **kwargs)
+            results = Snapshot(path).search_molecule(**kwargs)
+            assert expected[0].year is None
+            assert [_.id for _ in results] == [_.id for _ in expected]
+    finally:
+        connections.configure(**settings)
@@ -0,0 +1,15 @@
+from spacetar.startup import benchmark, commands
+
+
+def test_startup():
+
+    """"""
+
+    light = [_ for _ in commands if _[0] in ["complete", "help", "version"]]
+
+    timings = benchmark(light)
+
+    assert len(timings) == 3
+    assert all([not _["failures"] for _ in timings])
+    assert "sqlalchemy" not in timings[0]["modules"]
+    assert "rich.console" not in timings[0]["modules"]
@@ -0,0 +1,83 @@
+import pytest
+import shutil
+import sqlalchemy as sql
+
+from concurrent.futures import ThreadPoolExecutor
+
+from spacetar.core import connections
+from spacetar import search_source, search_molecule, search_telescope
+
+
+@pytest.fixture
+def configure():
+
+    """"""
+
+    settings = dict(connections.settings)
+    yield connections.configure
+    connections.configure(**settings)
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {},
+        {"immutable": True},
+        {"threaded": True, "size": 32},
+        {"size": 2, "overflow": 0},
+    ],
+)
+def test_hammer(configure, settings):
+
+    """"""
+
+    configure(**settings)
+
+    searches = [
+        (search_molecule, {"source": "TMC-1", "fields": ["name"]}),
+        (search_molecule, {"year": [1970, 1980], "include": ["sources"]}),
+        (search_source, {"kind": "Dark Cloud"}),
+        (search_telescope, {"wavelength": "mm", "fields": ["name", "detects"]}),
+    ]
+    expected = [[_.id for _ in search(**kwargs)] for search, kwargs in searches]
+
+    def hammer(i: int):
+        search, kwargs = searches[i % len(searches)]
+        return i % len(searches), [_.id for _ in search(cached=False, **kwargs)]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for i, ids in executor.map(hammer, range(96)):
+            assert ids == expected[i]
+
+    if not settings.get("threaded"):
+        assert connections.engine.pool.checkedout() == 0
+        assert connections.engine.pool.size() == settings.get("size", 8)
+
+
+def test_readonly():
+
+    """"""
+
+    assert "mode=ro" in connections.url
+    with pytest.raises(sql.exc.OperationalError):
+        with connections.connect() as connection:
+            connection.exec_driver_sql("DELETE FROM wavelengths")
+
+    with pytest.raises(ValueError):
+        connections.configure(poolsize=4)
+
+
+@pytest.mark.parametrize("readonly", [True, False])
+def test_escaped(tmp_path, configure, readonly):
+
+    """"""
+
+    folder = tmp_path / "we?ird#%20 dir"
+    folder.mkdir()
+    shutil.copy(connections.database, folder / "copy#%3F.db")
+    configure(database=folder / "copy#%3F.db", readonly=readonly)
+
+    with connections.connect() as connection:
+        databases = connection.exec_driver_sql("PRAGMA database_list").all()
+    assert databases[0][2] == str(folder / "copy#%3F.db")
+    assert [_.name for _ in search_source(name="Sgr B2")] == ["Sgr B2"]